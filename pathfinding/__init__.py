@@ -0,0 +1,32 @@
+import importlib
+
+from .core import (
+    DIRECTIONS_4,
+    DIRECTIONS_8,
+    GridSearcher,
+    a_star_search,
+    calculate_h_value,
+    is_destination,
+    is_unblocked,
+    is_valid,
+)
+from .batch import search_many
+from .cache import PathCache
+from .connectivity import ConnectivityIndex, label_components
+from .fields import DistanceField
+from .generators import generate_maze, generate_mazes, generate_obstacles, generate_random_grid
+from .hierarchical import HierarchicalPlanner
+from .incremental import DStarLitePlanner
+from .jps import JumpPointSearcher, jump_point_search
+from .parallel import ParallelPlanner
+from .trace import SearchTrace
+from .wavefront import WavefrontSearcher, wavefront_distances, wavefront_search
+
+# Submodules that pull in heavy dependencies (matplotlib, numba) and are only imported on first access
+_LAZY_SUBMODULES = ('visualization', 'accelerated')
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
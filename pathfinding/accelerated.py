@@ -0,0 +1,186 @@
+import numpy as np
+
+from .core import DIRECTIONS_4, SQRT2, GridSearcher, _unreachable_value
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Whether the compiled kernel can be used (numba is installed)
+AVAILABLE = numba is not None
+
+
+# The A* loops of GridSearcher.search over NumPy views of its buffers, written so numba can
+# compile them. It pops cells in exactly the order of the pure-Python loops: its binary heap
+# orders entries by (priority, cell) like heapq does with tuples, which is also the order of
+# the bucket queue, so both produce the same parent links and paths. unit selects the
+# unit-cost loop that stops when the destination is generated, otherwise the loop stops when
+# it is expanded. Cells whose heuristic is at least unreachable cannot reach the destination
+# and are skipped. Returns (found, expanded).
+def _search_kernel(masks, move_di, move_dj, move_offset, move_step, move_bit, cost, has_cost,
+                   heuristic, has_heuristic, unreachable, g, parent, stamp, open_mark, closed_mark,
+                   start, target, cols, unit, scale, diagonal):
+    dest_row = target // cols
+    dest_col = target % cols
+    move_count = len(move_offset)
+
+    # Binary heap of (priority, cell)
+    heap_priority = np.empty(256, dtype=np.float64)
+    heap_cell = np.empty(256, dtype=np.int64)
+
+    g[start] = 0.0
+    parent[start] = start
+    stamp[start] = open_mark
+    heap_priority[0] = 0.0
+    heap_cell[0] = start
+    count = 1
+    expanded = 0
+
+    while count > 0:
+        # Pop the cell with the lowest priority
+        current = heap_cell[0]
+        count -= 1
+        if count > 0:
+            last_priority = heap_priority[count]
+            last_cell = heap_cell[count]
+            position = 0
+            while True:
+                child = 2 * position + 1
+                if child >= count:
+                    break
+                if child + 1 < count and (heap_priority[child + 1] < heap_priority[child]
+                                          or (heap_priority[child + 1] == heap_priority[child]
+                                              and heap_cell[child + 1] < heap_cell[child])):
+                    child += 1
+                if heap_priority[child] < last_priority or (heap_priority[child] == last_priority
+                                                             and heap_cell[child] < last_cell):
+                    heap_priority[position] = heap_priority[child]
+                    heap_cell[position] = heap_cell[child]
+                    position = child
+                else:
+                    break
+            heap_priority[position] = last_priority
+            heap_cell[position] = last_cell
+
+        # Skip stale entries of cells that were already expanded with a lower priority
+        if stamp[current] == closed_mark:
+            continue
+        stamp[current] = closed_mark
+        expanded += 1
+        if not unit and current == target:
+            return True, expanded
+
+        i = current // cols
+        j = current % cols
+        g_current = g[current]
+        mask = masks[current]
+        for k in range(move_count):
+            if not mask & move_bit[k]:
+                continue
+            successor = current + move_offset[k]
+            if stamp[successor] == closed_mark:
+                continue
+            if unit and successor == target:
+                parent[successor] = current
+                return True, expanded
+            if has_heuristic and np.float64(heuristic[successor]) >= unreachable:
+                continue
+
+            if has_cost:
+                g_new = g_current + move_step[k] * np.float64(cost[successor])
+            else:
+                g_new = g_current + move_step[k]
+            if stamp[successor] != open_mark or g[successor] > g_new:
+                stamp[successor] = open_mark
+                g[successor] = g_new
+                parent[successor] = current
+                d_row = abs(i + move_di[k] - dest_row)
+                d_col = abs(j + move_dj[k] - dest_col)
+                if unit:
+                    priority = g_new + d_row + d_col
+                elif has_heuristic:
+                    priority = g_new + np.float64(heuristic[successor])
+                else:
+                    priority = g_new + scale * (d_row + d_col + diagonal * min(d_row, d_col))
+
+                # Push it onto the heap, growing the buffers when they are full
+                if count == len(heap_cell):
+                    grown_priority = np.empty(2 * count, dtype=np.float64)
+                    grown_priority[:count] = heap_priority
+                    heap_priority = grown_priority
+                    grown_cell = np.empty(2 * count, dtype=np.int64)
+                    grown_cell[:count] = heap_cell
+                    heap_cell = grown_cell
+                position = count
+                while position > 0:
+                    up = (position - 1) // 2
+                    if priority < heap_priority[up] or (priority == heap_priority[up] and successor < heap_cell[up]):
+                        heap_priority[position] = heap_priority[up]
+                        heap_cell[position] = heap_cell[up]
+                        position = up
+                    else:
+                        break
+                heap_priority[position] = priority
+                heap_cell[position] = successor
+                count += 1
+
+    return False, expanded
+
+
+_compiled_kernel = numba.njit(cache=True, nogil=True)(_search_kernel) if AVAILABLE else None
+
+
+# GridSearcher whose searches run the A* loop as a numba-compiled kernel over the same
+# buffers, returning the same paths. Without numba, with a SearchTrace attached, for
+# weighted, anytime or bidirectional queries it runs the pure-Python loops of GridSearcher
+# instead.
+class AcceleratedSearcher(GridSearcher):
+    def __init__(self, grid, directions=DIRECTIONS_4, components=None, trace=None, costs=None,
+                 diagonal_cost=SQRT2, corner_cutting=True):
+        super().__init__(grid, directions, components, trace, costs, diagonal_cost, corner_cutting)
+        if AVAILABLE:
+            self._views = (
+                np.frombuffer(self.masks, dtype=np.uint8),
+                np.array([di for di, _, _, _, _ in self.moves], dtype=np.int64),
+                np.array([dj for _, dj, _, _, _ in self.moves], dtype=np.int64),
+                np.array([offset for _, _, offset, _, _ in self.moves], dtype=np.int64),
+                np.array([step for _, _, _, step, _ in self.moves], dtype=np.float64),
+                np.array([bit for _, _, _, _, bit in self.moves], dtype=np.int64),
+            )
+            self._cost_view = (np.frombuffer(self.cost, dtype=np.float32) if self.cost is not None
+                               else np.zeros(1, dtype=np.float32))
+            self._g_view = np.frombuffer(self.g, dtype=np.float64)
+            self._parent_view = np.frombuffer(self.parent, dtype=np.int64)
+            self._stamp_view = np.frombuffer(self.stamp, dtype=np.uint64)
+
+    # Run the compiled kernel between two flat cell indices, like GridSearcher._find
+    def _find(self, start, target, heuristic=None, weight=1.0):
+        if not AVAILABLE or self.trace is not None or weight != 1.0:
+            return super()._find(start, target, heuristic, weight)
+
+        unit = self.cost is None and not self.diagonal and heuristic is None
+        if heuristic is None:
+            heuristic_view = np.zeros(1, dtype=np.float32)
+        else:
+            heuristic_view = np.asarray(heuristic)
+        unreachable = float(_unreachable_value(heuristic_view))
+
+        self.reset()
+        found, expanded = _compiled_kernel(
+            *self._views, self._cost_view, self.cost is not None, heuristic_view, heuristic is not None,
+            unreachable, self._g_view, self._parent_view, self._stamp_view, np.uint64(self.open_mark),
+            np.uint64(self.closed_mark), start, target, self.cols, unit,
+            self.min_cost, self.diagonal_cost - 2.0 if self.diagonal else 0.0)
+        self.expanded = int(expanded)
+        return bool(found)
+
+
+# Compile the kernel for the common argument types ahead of the first real query, so it does
+# not pay the compile time. Compiled code is cached on disk, later processes load it quickly.
+def warm_up():
+    if not AVAILABLE:
+        return
+    grid = np.ones((3, 3), dtype=np.uint8)
+    AcceleratedSearcher(grid).search((0, 0), (2, 2))
+    AcceleratedSearcher(grid, costs=np.full((3, 3), 1.5, dtype=np.float32)).search((0, 0), (2, 2))
@@ -0,0 +1,44 @@
+from .connectivity import ConnectivityIndex
+from .core import DIRECTIONS_4, GridSearcher
+
+
+# Answer many (src, dest) queries against one grid, yielding the paths in input order.
+# The grid is preprocessed once (search buffers and connected components), unreachable
+# queries are rejected without searching and queries sharing a source share one expansion.
+def search_many(grid, pairs, directions=DIRECTIONS_4):
+    if isinstance(grid, GridSearcher):
+        searcher = grid
+    else:
+        searcher = GridSearcher(grid, directions, ConnectivityIndex(grid, directions))
+    pairs = [((src[0], src[1]), (dest[0], dest[1])) for src, dest in pairs]
+
+    # Group the destinations of every source and count how often each query is asked
+    groups = {}
+    remaining = {}
+    for src, dest in pairs:
+        groups.setdefault(src, []).append(dest)
+        remaining[src, dest] = remaining.get((src, dest), 0) + 1
+
+    # Paths of sources that were already expanded, consumed as they are yielded
+    answered = {}
+
+    for src, dest in pairs:
+        dests = groups[src]
+        if len(dests) == 1:
+            # A lone query is cheaper as a goal-directed A* search
+            yield searcher.search(src, dest)
+            continue
+
+        if src not in answered:
+            answered[src] = searcher.search_from(src, dests)
+        paths = answered[src]
+
+        # Drop a path after the last query asking for it, and the source once it has none left
+        remaining[src, dest] -= 1
+        if remaining[src, dest]:
+            yield paths[dest]
+            continue
+        path = paths.pop(dest)
+        if not paths:
+            del answered[src]
+        yield path
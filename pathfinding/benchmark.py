@@ -0,0 +1,209 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+from .accelerated import AVAILABLE as ACCELERATED_AVAILABLE, AcceleratedSearcher, warm_up
+from .core import DIRECTIONS_4, GridSearcher, run_search
+from .generators import generate_maze, generate_obstacles, generate_random_grid
+from .hierarchical import HierarchicalPlanner
+from .jps import JumpPointSearcher
+from .maps import DEMO_GRID
+from .wavefront import WavefrontSearcher
+
+
+# Build a grid with one of the generators. The density is the obstacle share of the random
+# grid, the share of obstacle draws for generate_obstacles and the initial wall share of
+# generate_maze. The demo map ignores size and density.
+def make_grid(generator, size, density, seed):
+    if generator == 'demo':
+        return np.array(DEMO_GRID)
+    if generator == 'random':
+        return generate_random_grid(size, size, p_free=1 - density, seed=seed)
+    grid = np.ones((size, size), dtype=int)
+    if generator == 'obstacles':
+        generate_obstacles(grid, density, seed=seed)
+    elif generator == 'maze':
+        generate_maze(grid, density, seed=seed)
+    else:
+        raise ValueError(f"unknown generator {generator!r}")
+    return grid
+
+
+# Drive the script-facing a_star_search like the searcher objects: every query builds a new
+# GridSearcher and goes through run_search, as a_star_search does, and the wrapper keeps the
+# searcher's expansion count
+class _AStarFunction:
+    def __init__(self, grid):
+        self.grid = grid
+        self.expanded = 0
+
+    def search(self, src, dest):
+        searcher = GridSearcher(self.grid, DIRECTIONS_4)
+        with contextlib.redirect_stdout(io.StringIO()):
+            path = run_search(self.grid, src, dest, searcher.search)
+        self.expanded = searcher.expanded
+        return path
+
+
+# GridSearcher driven in bidirectional mode
+class _Bidirectional(GridSearcher):
+    def search(self, src, dest):
+        return self.search_bidirectional(src, dest)
+
+
+# Engines by name, each built from a grid and answering search(src, dest)
+ENGINES = {
+    'a_star_search': _AStarFunction,
+    'astar': lambda grid: GridSearcher(grid, DIRECTIONS_4),
+    'bidirectional': lambda grid: _Bidirectional(grid, DIRECTIONS_4),
+    'jps': lambda grid: JumpPointSearcher(grid, DIRECTIONS_4),
+    'hpa': lambda grid: HierarchicalPlanner(grid, cluster_size=16),
+    'wavefront': WavefrontSearcher,
+}
+
+# The compiled engine is only listed when numba is installed, it is compiled before the
+# timed queries
+if ACCELERATED_AVAILABLE:
+    def _accelerated(grid):
+        warm_up()
+        return AcceleratedSearcher(grid, DIRECTIONS_4)
+
+    ENGINES['accelerated'] = _accelerated
+
+GENERATORS = ('obstacles', 'maze', 'random', 'demo')
+
+
+# Random (src, dest) pairs of distinct free cells
+def make_queries(grid, count, seed):
+    free = np.argwhere(np.asarray(grid) == 1)
+    if len(free) < 2:
+        return []
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(free), size=(count, 2))
+    return [(tuple(map(int, free[a])), tuple(map(int, free[b]))) for a, b in picks if a != b]
+
+
+# Time one engine on one grid, then measure its peak memory in a separate traced pass
+def run_case(engine, grid, queries, memory_queries=10):
+    factory = ENGINES[engine]
+
+    start = time.perf_counter()
+    searcher = factory(grid)
+    build_seconds = time.perf_counter() - start
+
+    latencies = []
+    expanded = []
+    found = 0
+    total_start = time.perf_counter()
+    for src, dest in queries:
+        start = time.perf_counter()
+        path = searcher.search(src, dest)
+        latencies.append(time.perf_counter() - start)
+        if path:
+            found += 1
+        if searcher.expanded is not None:
+            expanded.append(searcher.expanded)
+    total_seconds = time.perf_counter() - total_start
+
+    tracemalloc.start()
+    traced = factory(grid)
+    for src, dest in queries[:memory_queries]:
+        traced.search(src, dest)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies_ms = np.array(latencies) * 1000.0
+    return {
+        'build_ms': build_seconds * 1000.0,
+        'queries': len(queries),
+        'found': found,
+        'latency_ms': {
+            'mean': float(latencies_ms.mean()) if latencies else None,
+            'p50': float(np.percentile(latencies_ms, 50)) if latencies else None,
+            'p90': float(np.percentile(latencies_ms, 90)) if latencies else None,
+            'p99': float(np.percentile(latencies_ms, 99)) if latencies else None,
+            'max': float(latencies_ms.max()) if latencies else None,
+        },
+        'queries_per_second': len(queries) / total_seconds if total_seconds > 0 else None,
+        'expanded_mean': float(np.mean(expanded)) if expanded else None,
+        'peak_memory_bytes': peak_bytes,
+    }
+
+
+# Commit of the working tree, if it is a git checkout
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Run the whole matrix and return the results as a JSON-serialisable dict
+def run_benchmark(sizes=(50, 100, 200), densities=(0.1, 0.2, 0.3), generators=GENERATORS,
+                  engines=tuple(ENGINES), queries=50, seed=0):
+    results = []
+    for generator in generators:
+        # The demo map has a fixed size and layout
+        cases = [(None, None)] if generator == 'demo' else [(size, density) for size in sizes for density in densities]
+        for size, density in cases:
+            grid = make_grid(generator, size, density, seed)
+            pairs = make_queries(grid, queries, seed)
+            for engine in engines:
+                result = run_case(engine, grid, pairs)
+                result.update({
+                    'generator': generator,
+                    'rows': int(grid.shape[0]),
+                    'cols': int(grid.shape[1]),
+                    'density': density,
+                    'free_share': float((grid == 1).mean()),
+                    'engine': engine,
+                })
+                results.append(result)
+                print(f"{generator:>9} {grid.shape[0]:>5}x{grid.shape[1]:<5} density={density!s:<5} "
+                      f"{engine:>14}: p50={result['latency_ms']['p50'] or 0:8.3f} ms "
+                      f"p99={result['latency_ms']['p99'] or 0:8.3f} ms "
+                      f"qps={result['queries_per_second'] or 0:9.1f} "
+                      f"expanded={result['expanded_mean'] or 0:10.1f} "
+                      f"peak={result['peak_memory_bytes'] / 1e6:7.2f} MB")
+
+    return {
+        'meta': {
+            'seed': seed,
+            'queries': queries,
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the path search engines over a matrix of grids.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200])
+    parser.add_argument('--densities', type=float, nargs='+', default=[0.1, 0.2, 0.3])
+    parser.add_argument('--generators', nargs='+', default=list(GENERATORS), choices=GENERATORS)
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES), choices=sorted(ENGINES))
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark_results.json')
+    args = parser.parse_args()
+
+    report = run_benchmark(args.sizes, args.densities, args.generators, args.engines, args.queries, args.seed)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print("Results saved to", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+
+
+# LRU cache of routes in front of a GridSearcher, for operators that keep asking for the same
+# dock-to-station routes. Entries are keyed by the searcher's grid version, the endpoints and
+# its movement rules, so changing cells through the searcher invalidates them. A cached route
+# also answers the reverse query when the searcher is reversible, that is when reversing an
+# optimal path gives an optimal path for the opposite direction.
+# The cache holds at most max_entries routes and, when max_cells is set, at most that many
+# path cells in total.
+class PathCache:
+    def __init__(self, searcher, max_entries=1024, max_cells=None):
+        self.searcher = searcher
+        self.max_entries = max_entries
+        self.max_cells = max_cells
+        self.routes = OrderedDict()
+        self.cells = 0
+        self.version = searcher.version
+        self.connectivity = (searcher.directions, searcher.diagonal_cost, searcher.corner_cutting)
+        self.reversible = searcher.reversible
+
+        # Counters since the cache was created
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        # Number of cells expanded by the last query, 0 when it was answered from the cache
+        self.expanded = 0
+
+    def __len__(self):
+        return len(self.routes)
+
+    # Drop every cached route
+    def clear(self):
+        self.routes.clear()
+        self.cells = 0
+
+    def _key(self, src, dest):
+        return (self.version, (int(src[0]), int(src[1])), (int(dest[0]), int(dest[1])), self.connectivity)
+
+    # Return the cached route, or search and remember it. Same return values as
+    # GridSearcher.search, invalid or blocked endpoints are never cached.
+    def search(self, src, dest):
+        if self.searcher.version != self.version:
+            self.invalidations += 1
+            self.clear()
+            self.version = self.searcher.version
+
+        routes = self.routes
+        key = self._key(src, dest)
+        route = routes.get(key)
+        if route is not None:
+            routes.move_to_end(key)
+            self.hits += 1
+            self.expanded = 0
+            return list(route)
+        if self.reversible:
+            reverse_key = self._key(dest, src)
+            route = routes.get(reverse_key)
+            if route is not None:
+                routes.move_to_end(reverse_key)
+                self.hits += 1
+                self.expanded = 0
+                return list(reversed(route))
+
+        self.misses += 1
+        path = self.searcher.search(src, dest)
+        self.expanded = self.searcher.expanded
+        if path is None:
+            return None
+
+        routes[key] = tuple(path)
+        self.cells += len(path)
+        while routes and (len(routes) > self.max_entries
+                          or (self.max_cells is not None and self.cells > self.max_cells)):
+            _, old = routes.popitem(last=False)
+            self.cells -= len(old)
+            self.evictions += 1
+        return path
@@ -0,0 +1,253 @@
+import numpy as np
+
+from .core import DIRECTIONS_4
+
+# Most cells the floods of ConnectivityIndex visit after a cell is blocked before it falls
+# back to relabelling the whole component
+FLOOD_LIMIT = 1 << 14
+
+
+# Label the connected components of the free cells, returns an int32 array holding 0 for
+# blocked cells and 1..n for the components. Works on whole arrays: every edge between
+# neighbouring free cells hooks the larger root onto the smaller one, then pointer jumping
+# flattens the trees, until the two ends of every edge share a root.
+def label_components(free, directions=DIRECTIONS_4):
+    free = np.asarray(free, dtype=bool)
+    rows, cols = free.shape
+    index = np.arange(rows * cols).reshape(rows, cols)
+
+    # Collect the edges between free neighbours, each undirected edge once
+    heads = []
+    tails = []
+    for di, dj in directions:
+        if di < 0 or (di == 0 and dj <= 0):
+            continue
+        row_slice = slice(0, rows - di)
+        col_slice = slice(max(0, -dj), cols - max(0, dj))
+        next_row_slice = slice(di, rows)
+        next_col_slice = slice(max(0, dj), cols - max(0, -dj))
+        both = free[row_slice, col_slice] & free[next_row_slice, next_col_slice]
+        heads.append(index[row_slice, col_slice][both])
+        tails.append(index[next_row_slice, next_col_slice][both])
+    heads = np.concatenate(heads) if heads else np.zeros(0, dtype=index.dtype)
+    tails = np.concatenate(tails) if tails else np.zeros(0, dtype=index.dtype)
+
+    parent = np.arange(rows * cols)
+    while heads.size:
+        head_roots = parent[heads]
+        tail_roots = parent[tails]
+
+        # Edges whose ends already share a root can never separate again
+        pending = head_roots != tail_roots
+        if not pending.any():
+            break
+        heads = heads[pending]
+        tails = tails[pending]
+        head_roots = head_roots[pending]
+        tail_roots = tail_roots[pending]
+
+        # Hook every root onto the smallest root it is connected to
+        np.minimum.at(parent, np.maximum(head_roots, tail_roots), np.minimum(head_roots, tail_roots))
+
+        # Pointer jumping until every cell points straight at its root
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    # Number the components 1..n in row-major order of their first cell
+    labels = np.zeros((rows, cols), dtype=np.int32)
+    roots = parent.reshape(rows, cols)[free]
+    if roots.size:
+        _, compact = np.unique(roots, return_inverse=True)
+        labels[free] = compact + 1
+    return labels
+
+
+# Connected-component index of a grid, answers "can src reach dest" in O(1)
+# and is kept up to date as cells become blocked or unblocked
+class ConnectivityIndex:
+    def __init__(self, grid, directions=DIRECTIONS_4):
+        self.free = np.asarray(grid) == 1
+        self.directions = tuple(directions)
+        self.labels = label_components(self.free, self.directions)
+        self.next_label = int(self.labels.max()) + 1
+
+    # Check if two cells are free and in the same component
+    def connected(self, src, dest):
+        label = self.labels[src[0], src[1]]
+        return label != 0 and label == self.labels[dest[0], dest[1]]
+
+    # Apply (row, col, value) changes, value being 1 for unblocked and 0 for blocked
+    def update(self, changes):
+        final = {}
+        for row, col, value in changes:
+            final[(row, col)] = value == 1
+
+        opened = []
+        closed = []
+        for (row, col), free in final.items():
+            if free == self.free[row, col]:
+                continue
+            self.free[row, col] = free
+            (opened if free else closed).append((row, col))
+
+        if closed:
+            self._split(closed)
+        if opened:
+            self._merge(opened)
+
+    # Free cells next to a cell along the moves of the index
+    def _neighbours(self, row, col):
+        free = self.free
+        rows, cols = free.shape
+        return [(row + di, col + dj) for di, dj in self.directions
+                if 0 <= row + di < rows and 0 <= col + dj < cols and free[row + di, col + dj]]
+
+    # Check if the free neighbours of a blocked cell still reach each other through the other
+    # cells of the 3x3 window around it. Then blocking it cannot split its component.
+    def _locally_connected(self, row, col):
+        neighbours = self._neighbours(row, col)
+        if len(neighbours) < 2:
+            return True
+        free = self.free
+        rows, cols = free.shape
+        window = set((row + di, col + dj) for di in (-1, 0, 1) for dj in (-1, 0, 1)
+                     if 0 <= row + di < rows and 0 <= col + dj < cols and free[row + di, col + dj])
+
+        # Flood the window from the first neighbour
+        reached = {neighbours[0]}
+        stack = [neighbours[0]]
+        while stack:
+            i, j = stack.pop()
+            for di, dj in self.directions:
+                cell = (i + di, j + dj)
+                if cell in window and cell not in reached:
+                    reached.add(cell)
+                    stack.append(cell)
+        return all(cell in reached for cell in neighbours)
+
+    # Flood from every free neighbour of a blocked cell, one cell per flood in turn. Floods
+    # that meet join. A flood that runs out before joining the others has covered a piece
+    # cut off from the component, which gets a new label, until a single flood is left.
+    # Returns False when the floods visit more than limit cells, leaving the labels alone.
+    def _separate(self, row, col, limit):
+        free = self.free
+        rows, cols = free.shape
+        directions = self.directions
+        neighbours = self._neighbours(row, col)
+        owner = {cell: k for k, cell in enumerate(neighbours)}
+        joined = list(range(len(neighbours)))
+        stacks = [[cell] for cell in neighbours]
+        alive = set(range(len(neighbours)))
+
+        def find(k):
+            while joined[k] != k:
+                k = joined[k]
+            return k
+
+        visited = len(neighbours)
+        pieces = []
+        while len(set(find(k) for k in alive)) > 1:
+            for k in alive:
+                if not stacks[k]:
+                    continue
+                i, j = stacks[k].pop()
+                for di, dj in directions:
+                    cell = (i + di, j + dj)
+                    if not (0 <= cell[0] < rows and 0 <= cell[1] < cols and free[cell]):
+                        continue
+                    other = owner.get(cell)
+                    if other is None:
+                        owner[cell] = k
+                        stacks[k].append(cell)
+                        visited += 1
+                    elif find(other) != find(k):
+                        joined[find(other)] = find(k)
+            if visited > limit:
+                return False
+
+            # A group of joined floods with nothing left to visit is a separate piece
+            for group in set(find(k) for k in alive):
+                members = [k for k in alive if find(k) == group]
+                if not any(stacks[k] for k in members) and len(set(find(k) for k in alive)) > 1:
+                    pieces.append(set(members))
+                    alive -= set(members)
+
+        for members in pieces:
+            for cell, k in owner.items():
+                if k in members:
+                    self.labels[cell] = self.next_label
+            self.next_label += 1
+        return True
+
+    # Blocking cells may split their components. The cells are blocked one at a time: a cell
+    # whose neighbours stay connected around it is only cleared, otherwise short floods from
+    # its neighbours find the pieces cut off, and only when those floods grow past
+    # FLOOD_LIMIT cells are the cells of its component relabelled.
+    def _split(self, closed):
+        labels = self.labels
+        free = self.free
+        for row, col in closed:
+            free[row, col] = True
+        affected = set()
+        for row, col in closed:
+            free[row, col] = False
+            label = int(labels[row, col])
+            labels[row, col] = 0
+            if label in affected or self._locally_connected(row, col):
+                continue
+            if not self._separate(row, col, FLOOD_LIMIT):
+                affected.add(label)
+        if not affected:
+            return
+        affected = list(affected)
+
+        mask = np.isin(labels, affected)
+        if not mask.any():
+            return
+        used_rows = np.flatnonzero(mask.any(axis=1))
+        used_cols = np.flatnonzero(mask.any(axis=0))
+        window = (slice(used_rows[0], used_rows[-1] + 1), slice(used_cols[0], used_cols[-1] + 1))
+
+        region_mask = mask[window]
+        region_labels = label_components(region_mask, self.directions)
+        labels[window][region_mask] = region_labels[region_mask] + (self.next_label - 1)
+        self.next_label += int(region_labels.max())
+
+    # Unblocking cells joins them with the components around them
+    def _merge(self, opened):
+        labels = self.labels
+        rows, cols = labels.shape
+        merged_into = {}
+
+        def find(label):
+            while label in merged_into:
+                label = merged_into[label]
+            return label
+
+        for row, col in opened:
+            around = set()
+            for di, dj in self.directions:
+                new_i = row + di
+                new_j = col + dj
+                if 0 <= new_i < rows and 0 <= new_j < cols and labels[new_i, new_j]:
+                    around.add(find(int(labels[new_i, new_j])))
+
+            if not around:
+                labels[row, col] = self.next_label
+                self.next_label += 1
+                continue
+
+            keep = min(around)
+            for label in around:
+                if label != keep:
+                    merged_into[label] = keep
+            labels[row, col] = keep
+
+        if merged_into:
+            table = np.arange(self.next_label, dtype=np.int32)
+            for label in merged_into:
+                table[label] = find(label)
+            self.labels = table[labels]
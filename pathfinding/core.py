@@ -0,0 +1,935 @@
+import heapq
+import math
+import time
+from array import array
+
+import numpy as np
+
+from .openset import make_open_set
+
+# Movement offsets (row, col) in the order a_star_search explores them: right, left, down, up
+DIRECTIONS_4 = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+# Movement offsets including diagonals: up, down, left, right, then the four diagonals
+DIRECTIONS_8 = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+
+INF = float('inf')
+SQRT2 = math.sqrt(2.0)
+
+# Stored distance of cells that cannot reach the goal in uint16 distance fields
+UNREACHABLE_UINT16 = np.iinfo(np.uint16).max
+
+# Largest whole-number step cost that still uses the bucket queue, beyond it the buckets get
+# too sparse to pay off
+BUCKET_MAX_STEP = 255
+
+
+# Precompute the moves of a searcher as (di, dj, offset, step, bit) tuples: the row and
+# column change, the change of the flat cell index, the step length (1, or diagonal_cost for
+# diagonal moves) and the move's bit in the neighbour masks
+def _move_table(directions, cols, diagonal_cost):
+    moves = []
+    for k, (di, dj) in enumerate(directions):
+        step = diagonal_cost if di != 0 and dj != 0 else 1.0
+        moves.append((di, dj, di * cols + dj, step, 1 << k))
+    return tuple(moves)
+
+
+# Heuristic value that marks cells which cannot reach the destination: UNREACHABLE_UINT16 for
+# uint16 sequences such as the flat view of a uint16 DistanceField, inf otherwise
+def _unreachable_value(heuristic):
+    if getattr(heuristic, 'format', None) == 'H' or getattr(heuristic, 'dtype', None) == np.uint16:
+        return UNREACHABLE_UINT16
+    return INF
+
+
+# Bitmask of the legal moves out of every cell of a boolean occupancy array: bit k is set when
+# move k stays inside the grid and lands on a free cell and, for diagonal moves without
+# corner_cutting, both cells beside the move are free. The occupancy is padded with a
+# one-cell blocked border so the grid edge needs no special case.
+def neighbour_masks(free, directions, corner_cutting=True):
+    rows, cols = free.shape
+    padded = np.zeros((rows + 2, cols + 2), dtype=bool)
+    padded[1:-1, 1:-1] = free
+
+    def shifted(di, dj):
+        return padded[1 + di:1 + di + rows, 1 + dj:1 + dj + cols]
+
+    masks = np.zeros((rows, cols), dtype=np.uint8)
+    for k, (di, dj) in enumerate(directions):
+        legal = free & shifted(di, dj)
+        if di != 0 and dj != 0 and not corner_cutting:
+            legal &= shifted(di, 0) & shifted(0, dj)
+        masks[legal] |= 1 << k
+    return masks
+
+
+# Reusable A* engine that keeps the search state of every cell in flat buffers
+# indexed by row * cols + col instead of a list of lists of Cell objects.
+# costs is an optional map of the cost of stepping onto every cell (inf for blocked cells),
+# without it every step costs 1. With DIRECTIONS_8 a diagonal step costs diagonal_cost times
+# as much (sqrt(2) by default, 1 for Chebyshev moves), and without corner_cutting a diagonal
+# step is only allowed when both cells beside it are free.
+class GridSearcher:
+    def __init__(self, grid, directions=DIRECTIONS_4, components=None, trace=None, costs=None,
+                 diagonal_cost=SQRT2, corner_cutting=True):
+        cells = np.asarray(grid)
+        self.rows, self.cols = cells.shape
+        self.directions = tuple(directions)
+        self.diagonal = any(di != 0 and dj != 0 for di, dj in self.directions)
+        self.diagonal_cost = float(diagonal_cost)
+        self.corner_cutting = corner_cutting
+        self.moves = _move_table(self.directions, self.cols, self.diagonal_cost)
+        if len(self.moves) > 8:
+            raise ValueError("at most 8 directions are supported")
+
+        # Optional ConnectivityIndex used to reject unreachable queries before searching
+        self.components = components
+        size = self.rows * self.cols
+
+        # Step costs as float32 and the smallest one, which scales the heuristic so it never
+        # overestimates the remaining cost
+        self.cost = None
+        self.min_cost = 1.0
+        if costs is not None:
+            costs = np.asarray(costs, dtype=np.float32)
+            if costs.shape != cells.shape:
+                raise ValueError("costs must have the same shape as the grid")
+            unblocked = (cells == 1) & np.isfinite(costs)
+            if (costs[unblocked] < 0).any():
+                raise ValueError("step costs must not be negative")
+            self.cost = array('f', np.where(unblocked, costs, np.inf).astype(np.float32).tobytes())
+            self.min_cost = float(costs[unblocked].min()) if unblocked.any() else 1.0
+
+        # Occupancy flattened row by row (1 for unblocked, 0 for blocked). A C-contiguous uint8
+        # grid of 0s and 1s, such as a memory-mapped map file, is used in place without a copy
+        # (update_cells then writes through to it).
+        if costs is None and cells.dtype == np.uint8 and cells.flags.c_contiguous and cells.size and cells.max() <= 1:
+            self.free = memoryview(cells).cast('B')
+        else:
+            if costs is None:
+                unblocked = cells == 1
+            self.free = bytearray(unblocked.astype(np.uint8).tobytes())
+
+        # Whole-number steps give whole-number priorities, which a bucket queue orders
+        # in O(1), otherwise the open set is a binary heap. The longest move multiplies the
+        # largest cell cost in the BUCKET_MAX_STEP check.
+        self.longest_move = max(1.0, self.diagonal_cost) if self.diagonal else 1.0
+        self.integer_priorities = not self.diagonal or self.diagonal_cost.is_integer()
+        if costs is not None:
+            steps = costs[unblocked]
+            self.integer_priorities = (self.integer_priorities and bool((steps == np.floor(steps)).all())
+                                       and (not steps.size or steps.max() * self.longest_move <= BUCKET_MAX_STEP))
+
+        # Legal moves out of every cell, so the search loops need a single lookup per
+        # neighbour instead of bounds, occupancy and corner checks
+        self.masks = bytearray(neighbour_masks(self._occupancy(), self.directions, corner_cutting))
+
+        # Cost from start and parent index of every cell
+        self.g = array('d', [INF]) * size
+        self.parent = array('q', [-1]) * size
+
+        # A cell's g and parent are only meaningful while its stamp matches the current
+        # query, so resetting between queries is a counter bump instead of a full clear
+        self.stamp = array('Q', [0]) * size
+        self.open_mark = 0
+        self.closed_mark = 0
+
+        # Buffers of the backward frontier, allocated on the first bidirectional query
+        self.g_back = None
+        self.parent_back = None
+        self.stamp_back = None
+
+        # Number of cells expanded by the last query
+        self.expanded = 0
+
+        # Whether a cheapest path from dest to src, reversed, is a cheapest path from src to
+        # dest. Reversing a path changes its cost by the difference of the endpoint costs as
+        # long as every step costs the same multiple of the cell it enters, which holds
+        # without a cost map and for cost maps without sqrt(2) diagonals.
+        self.reversible = self.cost is None or not self.diagonal or self.diagonal_cost == 1.0
+
+        # Bumped whenever cells or costs change, so cached results can tell they are stale
+        self.version = 0
+
+        # Optional SearchTrace that records the pushes and expansions of search and
+        # search_bidirectional, None skips recording
+        self.trace = trace
+
+    # Invalidate the state left behind by the previous query
+    def reset(self):
+        self.open_mark = self.closed_mark + 1
+        self.closed_mark = self.open_mark + 1
+
+    # Check if a cell is inside the grid and unblocked
+    def is_free(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.free[row * self.cols + col] == 1
+
+    # Occupancy as a (rows, cols) boolean array
+    def _occupancy(self):
+        return np.frombuffer(self.free, dtype=np.uint8).reshape(self.rows, self.cols) == 1
+
+    # Recompute the neighbour masks around changed cells, or everywhere for large changes
+    def _refresh_masks(self, cells):
+        rows = self.rows
+        cols = self.cols
+        masks = np.frombuffer(self.masks, dtype=np.uint8).reshape(rows, cols)
+        if len(cells) * 64 > rows * cols:
+            masks[:] = neighbour_masks(self._occupancy(), self.directions, self.corner_cutting)
+            return
+
+        free = np.frombuffer(self.free, dtype=np.uint8).reshape(rows, cols)
+        for row, col in cells:
+            # The masks of the cells next to a changed cell depend on the cells next to them
+            top, left = max(row - 2, 0), max(col - 2, 0)
+            window = neighbour_masks(free[top:row + 3, left:col + 3] == 1, self.directions, self.corner_cutting)
+            first_row, first_col = max(row - 1, 0), max(col - 1, 0)
+            masks[first_row:row + 2, first_col:col + 2] = window[first_row - top:row + 2 - top,
+                                                                 first_col - left:col + 2 - left]
+
+    # Apply (row, col, value) changes to the grid, value being 1 for unblocked and 0 for blocked.
+    # Searchers with a cost map change cells through update_costs instead, which also sets
+    # the cost of an unblocked cell.
+    def update_cells(self, changes):
+        if self.cost is not None:
+            raise ValueError("the searcher has a cost map, use update_costs to change cells")
+        changes = list(changes)
+        for row, col, value in changes:
+            self.free[row * self.cols + col] = 1 if value == 1 else 0
+        self.version += 1
+        self._refresh_masks([(row, col) for row, col, _ in changes])
+        if self.components is not None:
+            self.components.update(changes)
+
+    # Apply (row, col, cost) changes to a cost grid, an infinite cost blocks the cell
+    def update_costs(self, changes):
+        if self.cost is None:
+            raise ValueError("the searcher was built without a cost map")
+        self.version += 1
+        cells = []
+        for row, col, cost in changes:
+            index = row * self.cols + col
+            cost = float(cost)
+            if cost < 0:
+                raise ValueError("step costs must not be negative")
+            self.cost[index] = cost
+            free = 1 if cost != INF else 0
+            if free != self.free[index]:
+                cells.append((row, col, free))
+            self.free[index] = free
+            if free and cost < self.min_cost:
+                self.min_cost = cost
+            if free and (not cost.is_integer() or cost * self.longest_move > BUCKET_MAX_STEP):
+                self.integer_priorities = False
+        if cells:
+            self._refresh_masks([(row, col) for row, col, _ in cells])
+        if cells and self.components is not None:
+            self.components.update(cells)
+
+    # Check if dest is known to be unreachable from src without searching
+    def is_disconnected(self, src, dest):
+        return self.components is not None and not self.components.connected(src, dest)
+
+    # Yield the cells from index up to the start of the last search by following parent
+    # indices, without building a list
+    def walk_parents(self, index):
+        cols = self.cols
+        parent = self.parent
+        while True:
+            yield divmod(index, cols)
+            if parent[index] == index:
+                return
+            index = parent[index]
+
+    # Trace the path from source to destination by following parent indices
+    def trace_path(self, index):
+        cols = self.cols
+        parent = self.parent
+        path = [divmod(index, cols)]
+        while parent[index] != index:
+            index = parent[index]
+            path.append(divmod(index, cols))
+        path.reverse()
+        return path
+
+    # Find a path from src to dest, returns None for invalid or blocked endpoints
+    # and an empty list when the destination cannot be reached. heuristic optionally replaces
+    # the distance estimate with a flat per-cell sequence of remaining costs to dest, such as
+    # DistanceField.flat, and must never overestimate them. Cells whose heuristic is inf (or
+    # UNREACHABLE_UINT16 in a uint16 sequence) are skipped. A weight above 1 multiplies the
+    # heuristic (weighted A*), returning a path at most weight times as expensive as the
+    # cheapest one after fewer expansions.
+    def search(self, src, dest, bidirectional=False, heuristic=None, weight=1.0):
+        if bidirectional:
+            return self.search_bidirectional(src, dest)
+        if not self.is_free(src[0], src[1]) or not self.is_free(dest[0], dest[1]):
+            return None
+
+        cols = self.cols
+        start = src[0] * cols + src[1]
+        target = dest[0] * cols + dest[1]
+        if start == target:
+            return [(src[0], src[1])]
+        if self.is_disconnected(src, dest):
+            self.expanded = 0
+            return []
+        if weight < 1.0:
+            raise ValueError("weight must be at least 1")
+        if self._find(start, target, heuristic, weight):
+            return self.trace_path(target)
+        return []
+
+    # Run the search between two flat cell indices, leaving the parent links in the buffers
+    # for trace_path, and return whether target was reached. weight multiplies the heuristic:
+    # above 1 the search expands fewer cells and returns paths at most weight times as
+    # expensive as the optimal one.
+    def _find(self, start, target, heuristic=None, weight=1.0):
+        if self.cost is not None or self.diagonal or heuristic is not None or weight != 1.0:
+            return self._search_weighted(start, target, heuristic, weight)
+        return self._search_unit(start, target)
+
+    # Unit-cost 4-connected A*
+    def _search_unit(self, start, target):
+        rows = self.rows
+        cols = self.cols
+        self.reset()
+        open_mark = self.open_mark
+        closed_mark = self.closed_mark
+        masks = self.masks
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        moves = self.moves
+        dest_row, dest_col = divmod(target, cols)
+
+        # Initialize the start cell
+        g[start] = 0.0
+        parent[start] = start
+        stamp[start] = open_mark
+
+        open_set = make_open_set(True)
+        push = open_set.push
+        pop = open_set.pop
+        push(0, start)
+        expanded = 0
+        trace = self.trace
+        if trace is not None:
+            trace.start(rows, cols)
+            trace.push(start)
+
+        while True:
+            current = pop()
+            if current == -1:
+                break
+
+            # Skip stale entries of cells that were already expanded with a lower f
+            if stamp[current] == closed_mark:
+                continue
+            stamp[current] = closed_mark
+            expanded += 1
+            if trace is not None:
+                trace.expand(current)
+
+            i, j = divmod(current, cols)
+            g_new = g[current] + 1.0
+
+            mask = masks[current]
+            for di, dj, offset, step, bit in moves:
+                if not mask & bit:
+                    continue
+                successor = current + offset
+                if stamp[successor] == closed_mark:
+                    continue
+
+                # Stop as soon as the destination is generated, like a_star_search
+                if successor == target:
+                    parent[successor] = current
+                    if trace is not None:
+                        trace.push(successor)
+                    self.expanded = expanded
+                    return True
+
+                # Add the cell to the open list if it is new or reached more cheaply
+                if stamp[successor] != open_mark or g[successor] > g_new:
+                    stamp[successor] = open_mark
+                    g[successor] = g_new
+                    parent[successor] = current
+                    push(g_new + abs(i + di - dest_row) + abs(j + dj - dest_col), successor)
+                    if trace is not None:
+                        trace.push(successor)
+
+        self.expanded = expanded
+        return False
+
+    # Admissible distance estimate for the moves of this searcher, before scaling by the
+    # cheapest cell: Manhattan for 4 directions, octile for diagonal steps of sqrt(2) and
+    # Chebyshev for diagonal steps of 1
+    def heuristic(self, src, dest):
+        d_row = abs(src[0] - dest[0])
+        d_col = abs(src[1] - dest[1])
+        if not self.diagonal:
+            return d_row + d_col
+        return d_row + d_col + (self.diagonal_cost - 2.0) * min(d_row, d_col)
+
+    # A* over the cost map and diagonal moves. A cheaper route to the destination may still be
+    # found after it is generated, so unlike the unit-cost search it stops when the destination
+    # is expanded.
+    def _search_weighted(self, start, target, heuristic=None, weight=1.0):
+        self.reset()
+        rows = self.rows
+        cols = self.cols
+        open_mark = self.open_mark
+        closed_mark = self.closed_mark
+        masks = self.masks
+        cost = self.cost
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        moves = self.moves
+        dest_row, dest_col = divmod(target, cols)
+        scale = self.min_cost * weight
+
+        # With diagonal moves the heuristic is d_row + d_col + diagonal * min(d_row, d_col)
+        diagonal = self.diagonal_cost - 2.0 if self.diagonal else 0.0
+
+        # Cells with this heuristic value cannot reach the destination
+        unreachable = _unreachable_value(heuristic)
+
+        g[start] = 0.0
+        parent[start] = start
+        stamp[start] = open_mark
+
+        open_set = make_open_set(self.integer_priorities and float(weight).is_integer())
+        push = open_set.push
+        pop = open_set.pop
+        push(0, start)
+        expanded = 0
+        trace = self.trace
+        if trace is not None:
+            trace.start(rows, cols)
+            trace.push(start)
+
+        while True:
+            current = pop()
+            if current == -1:
+                break
+            if stamp[current] == closed_mark:
+                continue
+            stamp[current] = closed_mark
+            expanded += 1
+            if trace is not None:
+                trace.expand(current)
+            if current == target:
+                self.expanded = expanded
+                return True
+
+            i, j = divmod(current, cols)
+            g_current = g[current]
+
+            mask = masks[current]
+            for di, dj, offset, step, bit in moves:
+                if not mask & bit:
+                    continue
+                successor = current + offset
+                if stamp[successor] == closed_mark:
+                    continue
+                if heuristic is not None and heuristic[successor] >= unreachable:
+                    continue
+                g_new = g_current + (step * cost[successor] if cost is not None else step)
+                if stamp[successor] != open_mark or g[successor] > g_new:
+                    stamp[successor] = open_mark
+                    g[successor] = g_new
+                    parent[successor] = current
+                    if heuristic is not None:
+                        push(g_new + weight * heuristic[successor], successor)
+                    else:
+                        d_row = abs(i + di - dest_row)
+                        d_col = abs(j + dj - dest_col)
+                        h = d_row + d_col + diagonal * (d_row if d_row < d_col else d_col)
+                        push(g_new + scale * h, successor)
+                    if trace is not None:
+                        trace.push(successor)
+
+        self.expanded = expanded
+        return False
+
+    # Find a path from src to dest by growing A* frontiers from both ends, expanding
+    # the smaller one each step, until neither can improve on the best meeting cell.
+    # Cost grids and diagonal moves are searched from the source only.
+    def search_bidirectional(self, src, dest):
+        if self.cost is not None or self.diagonal:
+            return self.search(src, dest)
+        if not self.is_free(src[0], src[1]) or not self.is_free(dest[0], dest[1]):
+            return None
+
+        rows = self.rows
+        cols = self.cols
+        start = src[0] * cols + src[1]
+        target = dest[0] * cols + dest[1]
+        if start == target:
+            return [(src[0], src[1])]
+        if self.is_disconnected(src, dest):
+            self.expanded = 0
+            return []
+
+        if self.g_back is None:
+            size = rows * cols
+            self.g_back = array('d', [INF]) * size
+            self.parent_back = array('q', [-1]) * size
+            self.stamp_back = array('Q', [0]) * size
+
+        self.reset()
+        open_mark = self.open_mark
+        closed_mark = self.closed_mark
+        masks = self.masks
+        moves = self.moves
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        # Each side searches towards the other end: (g, parent, stamp, open list, goal row, goal col)
+        forward = (self.g, self.parent, self.stamp, [], dest[0], dest[1])
+        backward = (self.g_back, self.parent_back, self.stamp_back, [], src[0], src[1])
+        for (g, parent, stamp, open_list, goal_row, goal_col), origin in ((forward, start), (backward, target)):
+            i, j = divmod(origin, cols)
+            g[origin] = 0.0
+            parent[origin] = origin
+            stamp[origin] = open_mark
+            open_list.append((abs(i - goal_row) + abs(j - goal_col), origin))
+
+        best = INF
+        meeting = -1
+        expanded = 0
+        trace = self.trace
+        if trace is not None:
+            trace.start(rows, cols)
+            trace.push(start)
+            trace.push(target)
+
+        while forward[3] and backward[3]:
+            # No path through either frontier can beat the best meeting cell found so far
+            if forward[3][0][0] >= best or backward[3][0][0] >= best:
+                break
+
+            if len(forward[3]) <= len(backward[3]):
+                side, other = forward, backward
+            else:
+                side, other = backward, forward
+            g, parent, stamp, open_list, goal_row, goal_col = side
+            g_other, stamp_other = other[0], other[2]
+
+            f, current = heappop(open_list)
+            if stamp[current] == closed_mark:
+                continue
+            stamp[current] = closed_mark
+            expanded += 1
+            if trace is not None:
+                trace.expand(current)
+
+            i, j = divmod(current, cols)
+            g_new = g[current] + 1.0
+
+            mask = masks[current]
+            for di, dj, offset, step, bit in moves:
+                if not mask & bit:
+                    continue
+                successor = current + offset
+                if stamp[successor] == closed_mark:
+                    continue
+                if stamp[successor] != open_mark or g[successor] > g_new:
+                    stamp[successor] = open_mark
+                    g[successor] = g_new
+                    parent[successor] = current
+                    heappush(open_list, (g_new + abs(i + di - goal_row) + abs(j + dj - goal_col), successor))
+                    if trace is not None:
+                        trace.push(successor)
+
+                    # Remember the cheapest cell reached from both ends
+                    if stamp_other[successor] >= open_mark and g_new + g_other[successor] < best:
+                        best = g_new + g_other[successor]
+                        meeting = successor
+
+        self.expanded = expanded
+        if meeting == -1:
+            return []
+
+        # Join the forward half with the backward half walked from the meeting cell
+        path = self.trace_path(meeting)
+        parent_back = self.parent_back
+        index = meeting
+        while parent_back[index] != index:
+            index = parent_back[index]
+            path.append(divmod(index, cols))
+        return path
+
+    # Find paths from src to several destinations with a single Dijkstra expansion that
+    # stops once every reachable destination is settled, returns a dict keyed by destination
+    def search_from(self, src, dests):
+        dests = [(dest[0], dest[1]) for dest in dests]
+        if not self.is_free(src[0], src[1]):
+            return {dest: None for dest in dests}
+
+        cols = self.cols
+        start = src[0] * cols + src[1]
+        pending = set(dest[0] * cols + dest[1] for dest in dests
+                      if self.is_free(dest[0], dest[1]) and not self.is_disconnected(src, dest))
+
+        self.reset()
+        open_mark = self.open_mark
+        closed_mark = self.closed_mark
+        masks = self.masks
+        cost = self.cost
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        moves = self.moves
+
+        g[start] = 0.0
+        parent[start] = start
+        stamp[start] = open_mark
+
+        open_set = make_open_set(self.integer_priorities)
+        push = open_set.push
+        pop = open_set.pop
+        push(0, start)
+        expanded = 0
+
+        while pending:
+            current = pop()
+            if current == -1:
+                break
+            if stamp[current] == closed_mark:
+                continue
+            stamp[current] = closed_mark
+            expanded += 1
+            pending.discard(current)
+            g_current = g[current]
+
+            mask = masks[current]
+            for di, dj, offset, step, bit in moves:
+                if not mask & bit:
+                    continue
+                successor = current + offset
+                if stamp[successor] == closed_mark:
+                    continue
+                g_new = g_current + (step * cost[successor] if cost is not None else step)
+                if stamp[successor] != open_mark or g[successor] > g_new:
+                    stamp[successor] = open_mark
+                    g[successor] = g_new
+                    parent[successor] = current
+                    push(g_new, successor)
+
+        self.expanded = expanded
+
+        # Trace every settled destination, unreachable ones get an empty path
+        paths = {}
+        for dest in dests:
+            if not self.is_free(dest[0], dest[1]):
+                paths[dest] = None
+                continue
+            target = dest[0] * cols + dest[1]
+            paths[dest] = self.trace_path(target) if stamp[target] == closed_mark else []
+        return paths
+
+    # Yield the cells of a path from src to dest in order, source first, or with waypoints
+    # only the cells where the direction changes. When the searcher is reversible the search
+    # runs from dest to src, so the parent links already lead from src towards dest and cells
+    # are yielded as they are read, without building or reversing a list. Nothing is yielded
+    # for invalid or blocked endpoints or when there is no path. The cells are read from the
+    # search buffers, so run no other query on this searcher until the generator is done.
+    def iter_path(self, src, dest, waypoints=False):
+        if not self.is_free(src[0], src[1]) or not self.is_free(dest[0], dest[1]):
+            return
+        cols = self.cols
+        start = src[0] * cols + src[1]
+        target = dest[0] * cols + dest[1]
+        if start == target:
+            yield (src[0], src[1])
+            return
+        if self.is_disconnected(src, dest):
+            self.expanded = 0
+            return
+
+        if self.reversible:
+            if not self._find(target, start):
+                return
+            cells = self.walk_parents(start)
+        else:
+            if not self._find(start, target):
+                return
+            cells = self.trace_path(target)
+        if waypoints:
+            cells = compress_path(cells)
+        yield from cells
+
+    # Anytime Repairing A* (ARA*) between two flat cell indices. Each round runs A* with the
+    # heuristic multiplied by the next weight, keeping the costs and parent links of the
+    # earlier rounds: cells whose cost drops after they were expanded in a round are set
+    # aside and only reopened with the next, lower weight, so a round repairs the previous
+    # solution instead of starting over. After every round, and when the time budget (in
+    # seconds) or the expansion budget runs out, yields (cost, bound): the cost of the best
+    # path to target (inf while there is none) and a bound on how many times the cheapest
+    # path's cost it can be (inf without a path), ending early once the bound reaches 1. The
+    # path traced from the parent links costs at most the yielded cost.
+    def _search_anytime(self, start, target, weights, time_budget=None, max_expansions=None):
+        for weight in weights:
+            if weight < 1.0:
+                raise ValueError("weights must be at least 1")
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+
+        self.reset()
+        first_mark = self.open_mark
+        cols = self.cols
+        masks = self.masks
+        cost = self.cost
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        moves = self.moves
+        dest_row, dest_col = divmod(target, cols)
+        scale = self.min_cost
+        diagonal = self.diagonal_cost - 2.0 if self.diagonal else 0.0
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        # Unweighted heuristic of a cell, scaled like in _search_weighted
+        def estimate(cell):
+            d_row = abs(cell // cols - dest_row)
+            d_col = abs(cell % cols - dest_col)
+            return scale * (d_row + d_col + diagonal * (d_row if d_row < d_col else d_col))
+
+        g[start] = 0.0
+        parent[start] = start
+        stamp[start] = self.open_mark
+
+        # Open entries are (f, -g, cell): among equal f the deepest cell goes first, which
+        # keeps the rounds with low weights close to the expansions of plain A*
+        open_list = [(0.0, 0.0, start)]
+        inconsistent = set()
+        found = INF
+        expanded = 0
+        self.expanded = 0
+
+        for round_number, weight in enumerate(weights):
+            # Reopen the cells set aside in the previous round, ordered by the new weight
+            if round_number:
+                cells = set(cell for _, _, cell in open_list if stamp[cell] != self.closed_mark)
+                cells |= inconsistent
+                inconsistent = set()
+                self.reset()
+                open_list = [(g[cell] + weight * estimate(cell), -g[cell], cell) for cell in cells]
+                heapq.heapify(open_list)
+            open_mark = self.open_mark
+            closed_mark = self.closed_mark
+            weighted_scale = scale * weight
+
+            # Expand until no open cell could lead to a cheaper path to target
+            out_of_budget = False
+            while open_list:
+                f, _, current = open_list[0]
+                if stamp[current] == closed_mark:
+                    heappop(open_list)
+                    continue
+                if found <= f:
+                    break
+                if ((max_expansions is not None and expanded >= max_expansions)
+                        or (deadline is not None and time.perf_counter() > deadline)):
+                    out_of_budget = True
+                    break
+                heappop(open_list)
+                stamp[current] = closed_mark
+                expanded += 1
+
+                i, j = divmod(current, cols)
+                g_current = g[current]
+                mask = masks[current]
+                for di, dj, offset, step, bit in moves:
+                    if not mask & bit:
+                        continue
+                    successor = current + offset
+                    g_new = g_current + (step * cost[successor] if cost is not None else step)
+                    if stamp[successor] >= first_mark and g[successor] <= g_new:
+                        continue
+                    g[successor] = g_new
+                    parent[successor] = current
+                    if successor == target:
+                        found = g_new
+                    if stamp[successor] == closed_mark:
+                        inconsistent.add(successor)
+                    else:
+                        stamp[successor] = open_mark
+                        d_row = abs(i + di - dest_row)
+                        d_col = abs(j + dj - dest_col)
+                        h = d_row + d_col + diagonal * (d_row if d_row < d_col else d_col)
+                        heappush(open_list, (g_new + weighted_scale * h, -g_new, successor))
+            self.expanded = expanded
+
+            # Every cheaper path passes through an open or set-aside cell, so the smallest
+            # unweighted f among them is a lower bound on the cheapest cost
+            if found == INF:
+                bound = INF
+            else:
+                lower = INF
+                for _, _, cell in open_list:
+                    if stamp[cell] != closed_mark:
+                        lower = min(lower, g[cell] + estimate(cell))
+                for cell in inconsistent:
+                    lower = min(lower, g[cell] + estimate(cell))
+                bound = 1.0 if lower >= found else found / lower if lower > 0 else INF
+                if not out_of_budget:
+                    bound = min(bound, float(weight))
+                bound = max(bound, 1.0)
+            yield found, bound
+            if out_of_budget or bound == 1.0 or found == INF:
+                return
+
+    # Anytime search: yield (path, bound) pairs of ever cheaper paths from src to dest, each
+    # costing at most bound times the cheapest path, with waypoints only the cells where the
+    # direction changes. weights is the schedule of heuristic weights of _search_anytime: a
+    # single weight gives weighted A*, a last weight of 1 makes the last path optimal. The
+    # search stops after time_budget seconds (counted from the call, including the time the
+    # caller spends between paths) or max_expansions expansions. Nothing is yielded for
+    # invalid or blocked endpoints or when no path is found.
+    def iter_anytime(self, src, dest, weights=(3.0, 2.0, 1.5, 1.0), time_budget=None, max_expansions=None,
+                     waypoints=False):
+        if not self.is_free(src[0], src[1]) or not self.is_free(dest[0], dest[1]):
+            return
+        cols = self.cols
+        start = src[0] * cols + src[1]
+        target = dest[0] * cols + dest[1]
+        if start == target:
+            yield [(src[0], src[1])], 1.0
+            return
+        if self.is_disconnected(src, dest):
+            self.expanded = 0
+            return
+
+        best = INF
+        for found, bound in self._search_anytime(start, target, weights, time_budget, max_expansions):
+            if found < best:
+                path = self.trace_path(target)
+                path_cost = self.path_cost(path)
+                if path_cost < best:
+                    best = path_cost
+                    yield (list(compress_path(path)) if waypoints else path), bound
+
+    # Best path from src to dest that ARA* finds within the budget, see iter_anytime, and the
+    # achieved bound on its cost as a multiple of the cheapest cost. Returns (None, inf) for
+    # invalid or blocked endpoints and ([], inf) when no path was found.
+    def search_anytime(self, src, dest, weights=(3.0, 2.0, 1.5, 1.0), time_budget=None, max_expansions=None):
+        if not self.is_free(src[0], src[1]) or not self.is_free(dest[0], dest[1]):
+            return None, INF
+        cols = self.cols
+        start = src[0] * cols + src[1]
+        target = dest[0] * cols + dest[1]
+        if start == target:
+            return [(src[0], src[1])], 1.0
+        if self.is_disconnected(src, dest):
+            self.expanded = 0
+            return [], INF
+
+        best = INF
+        path = []
+        bound = INF
+        for found, bound in self._search_anytime(start, target, weights, time_budget, max_expansions):
+            if found < best:
+                candidate = self.trace_path(target)
+                path_cost = self.path_cost(candidate)
+                if path_cost < best:
+                    best = path_cost
+                    path = candidate
+        return path, bound
+
+    # Cost of a path of adjacent cells under this searcher's step costs
+    def path_cost(self, path):
+        cols = self.cols
+        cost = self.cost
+        total = 0.0
+        for (row, col), (next_row, next_col) in zip(path, path[1:]):
+            step = self.diagonal_cost if row != next_row and col != next_col else 1.0
+            total += step * cost[next_row * cols + next_col] if cost is not None else step
+        return total
+
+
+# Check if a cell is valid (within the grid)
+def is_valid(grid, row, col):
+    return 0 <= row < len(grid) and 0 <= col < len(grid[0])
+
+
+# Check if a cell is unblocked
+def is_unblocked(grid, row, col):
+    if not is_valid(grid, row, col):
+        return False
+    return grid[row][col] == 1
+
+
+# Check if a cell is the destination
+def is_destination(row, col, dest):
+    return row == dest[0] and col == dest[1]
+
+
+# Calculate the heuristic value of a cell (Manhattan distance to destination)
+def calculate_h_value(row, col, dest):
+    return abs(row - dest[0]) + abs(col - dest[1])
+
+
+# Keep the first and last cells of a path and the cells where its direction changes
+def compress_path(cells):
+    previous = None
+    step = None
+    for cell in cells:
+        if previous is None:
+            yield cell
+        else:
+            new_step = (cell[0] - previous[0], cell[1] - previous[1])
+            if step is not None and new_step != step:
+                yield previous
+            step = new_step
+        previous = cell
+    if step is not None:
+        yield previous
+
+
+# Check the endpoints, run the search function and report the outcome like the original scripts
+def run_search(grid, src, dest, search):
+    # Check if the source and destination are valid
+    if not is_valid(grid, src[0], src[1]) or not is_valid(grid, dest[0], dest[1]):
+        print("Source or destination is invalid")
+        return
+
+    # Check if the source and destination are unblocked
+    if not is_unblocked(grid, src[0], src[1]) or not is_unblocked(grid, dest[0], dest[1]):
+        print("Source or the destination is blocked")
+        return
+
+    # Check if we are already at the destination
+    if is_destination(src[0], src[1], dest):
+        print("We are already at the destination")
+        return
+
+    path = search(src, dest)
+    if path:
+        print("The destination cell is found")
+        return path
+
+    # If the destination is not found after visiting all cells
+    print("Failed to find the destination cell")
+    return []
+
+
+# Implement the A* search algorithm, optionally growing frontiers from both ends and
+# recording the explored cells into a SearchTrace. With a cost map every step costs the
+# cost of the cell it enters and cells with an infinite cost count as blocked. With
+# DIRECTIONS_8 diagonal steps cost sqrt(2) and corner_cutting=False keeps them off the
+# corners of blocked cells. A weight above 1 turns it into weighted A*, which finds a path
+# at most weight times as expensive as the cheapest one while expanding fewer cells.
+def a_star_search(grid, src, dest, directions=DIRECTIONS_4, bidirectional=False, trace=None, costs=None,
+                  corner_cutting=True, weight=1.0):
+    searcher = GridSearcher(grid, directions, trace=trace, costs=costs, corner_cutting=corner_cutting)
+    if costs is not None:
+        grid = np.where(np.isfinite(costs), grid, 0)
+    if bidirectional:
+        search = searcher.search_bidirectional
+    else:
+        def search(src, dest):
+            return searcher.search(src, dest, weight=weight)
+    return run_search(grid, src, dest, search)
@@ -0,0 +1,134 @@
+from array import array
+
+import numpy as np
+
+from .core import INF, UNREACHABLE_UINT16
+from .openset import make_open_set
+
+
+# Cost of the cheapest route from every cell to one fixed goal, found with a single reverse
+# Dijkstra search using the grid, step costs and movement rules of a GridSearcher. A robot
+# routes to the goal by walking downhill in O(path length) without any search, and the flat
+# distances make a perfect heuristic for GridSearcher.search towards the same goal.
+# Distances are stored as uint16 when every step cost is a whole number and they fit
+# (UNREACHABLE_UINT16 marks unreachable cells) and as float32 with inf otherwise.
+class DistanceField:
+    def __init__(self, searcher, goal, distances=None):
+        self.searcher = searcher
+        self.goal = (int(goal[0]), int(goal[1]))
+        if distances is None:
+            distances = self._compute()
+        self.distances = distances
+
+        # Flat view for fast per-cell lookups, also usable as GridSearcher.search(heuristic=...)
+        self.flat = memoryview(np.ascontiguousarray(distances).reshape(-1))
+        self.unreachable = UNREACHABLE_UINT16 if distances.dtype == np.uint16 else INF
+
+    # Reverse Dijkstra from the goal: a step from cell to successor costs the successor's cost,
+    # so a settled cell passes its distance plus its own step cost on to the cells next to it
+    def _compute(self):
+        searcher = self.searcher
+        rows = searcher.rows
+        cols = searcher.cols
+        masks = searcher.masks
+        cost = searcher.cost
+        moves = searcher.moves
+        dist = array('d', [INF]) * (rows * cols)
+        settled = bytearray(rows * cols)
+
+        goal = self.goal[0] * cols + self.goal[1]
+        if searcher.is_free(*self.goal):
+            open_set = make_open_set(searcher.integer_priorities)
+            push = open_set.push
+            pop = open_set.pop
+            dist[goal] = 0.0
+            push(0, goal)
+
+            while True:
+                current = pop()
+                if current == -1:
+                    break
+                if settled[current]:
+                    continue
+                settled[current] = 1
+
+                # Moves are symmetric, so the legal moves out of a cell are also the legal
+                # moves into it
+                d_current = dist[current]
+                mask = masks[current]
+                for di, dj, offset, step, bit in moves:
+                    if not mask & bit:
+                        continue
+                    other = current + offset
+                    if settled[other]:
+                        continue
+                    d_new = d_current + (step * cost[current] if cost is not None else step)
+                    if d_new < dist[other]:
+                        dist[other] = d_new
+                        push(d_new, other)
+
+        distances = np.frombuffer(dist, dtype=np.float64).reshape(rows, cols)
+        reachable = np.isfinite(distances)
+        if searcher.integer_priorities and (not reachable.any() or distances[reachable].max() < UNREACHABLE_UINT16):
+            return np.where(reachable, distances, UNREACHABLE_UINT16).astype(np.uint16)
+        return distances.astype(np.float32)
+
+    # Cost of the cheapest route from a cell to the goal, inf when there is none
+    def distance(self, cell):
+        value = self.flat[cell[0] * self.searcher.cols + cell[1]]
+        return INF if value == self.unreachable else float(value)
+
+    # Walk downhill from src to the goal. Returns None for invalid or blocked cells and an
+    # empty list when the goal cannot be reached, like GridSearcher.search
+    def path_from(self, src):
+        searcher = self.searcher
+        if not searcher.is_free(src[0], src[1]):
+            return None
+
+        rows = searcher.rows
+        cols = searcher.cols
+        masks = searcher.masks
+        cost = searcher.cost
+        flat = self.flat
+        current = src[0] * cols + src[1]
+        goal = self.goal[0] * cols + self.goal[1]
+        if flat[current] == self.unreachable:
+            return []
+
+        path = [divmod(current, cols)]
+        for _ in range(rows * cols):
+            if current == goal:
+                return path
+
+            # Take the step whose cost plus remaining distance is smallest
+            best = INF
+            best_cell = -1
+            mask = masks[current]
+            for di, dj, offset, step, bit in searcher.moves:
+                if not mask & bit:
+                    continue
+                other = current + offset
+                if flat[other] == self.unreachable:
+                    continue
+                total = (step * cost[other] if cost is not None else step) + flat[other]
+                if total < best:
+                    best = total
+                    best_cell = other
+            if best_cell == -1:
+                return []
+            current = best_cell
+            path.append(divmod(current, cols))
+        return []
+
+    # Write the distances as a .npy file that load can memory-map
+    def save(self, filename):
+        np.save(filename, self.distances)
+
+    # Read a field saved with save for the same searcher and goal, memory-mapped by default
+    # so only the pages a robot walks over are read from disk
+    @classmethod
+    def load(cls, searcher, goal, filename, mmap=True):
+        distances = np.load(filename, mmap_mode='r' if mmap else None)
+        if distances.shape != (searcher.rows, searcher.cols):
+            raise ValueError("the field does not match the searcher's grid")
+        return cls(searcher, goal, distances)
@@ -0,0 +1,87 @@
+import numpy as np
+
+
+# Random source for the generators: the global NumPy state when seed is None (as before),
+# otherwise a RandomState seeded the same way np.random.seed(seed) would be
+def _random_state(seed):
+    return np.random if seed is None else np.random.RandomState(seed)
+
+
+# Draw count random (row, col) cells in one call. Passing the bounds as an array keeps the
+# same draws as alternating np.random.randint(0, rows) and np.random.randint(0, cols) calls.
+def _random_cells(random, count, rows, cols):
+    cells = random.randint(0, np.tile([rows, cols], count)).reshape(count, 2)
+    return cells[:, 0], cells[:, 1]
+
+
+# Generate random obstacles in the grid
+def generate_obstacles(grid, density=0.2, seed=None):
+    rows, cols = grid.shape
+    num_obstacles = int(density * rows * cols)  # 20% of total cells as obstacles by default
+    obstacle_rows, obstacle_cols = _random_cells(_random_state(seed), num_obstacles, rows, cols)
+    grid[obstacle_rows, obstacle_cols] = 0  # Mark the cells as blocked
+
+
+# Smooth the walls of a stack of grids (maps, rows, cols) in place so walls grow into
+# maze-like corridors. Each pass gives the same result as visiting the interior cells row by
+# row and blocking every cell with more than 5 blocked cells in its 3x3 neighbourhood, where
+# cells blocked earlier in the same pass already count.
+def _smooth_walls(walls, passes=3):
+    maps, rows, cols = walls.shape
+    if rows < 3 or cols < 3:
+        return
+    positions = np.arange(cols - 2)
+
+    for _ in range(passes):
+        for i in range(1, rows - 1):
+            above = walls[:, i - 1].astype(np.int8)  # already smoothed in this pass
+            below = walls[:, i + 1].astype(np.int8)  # not smoothed yet
+            row = walls[:, i]
+
+            # Blocked neighbours of every interior cell except its left neighbour, which
+            # may be blocked earlier in this same row
+            counts = (above[:, :-2] + above[:, 1:-1] + above[:, 2:]
+                      + below[:, :-2] + below[:, 1:-1] + below[:, 2:]
+                      + row[:, 1:-1] + row[:, 2:])
+
+            # A cell ends up blocked if it already was, if it has 6 other blocked neighbours,
+            # or if it has 5 and its left neighbour ended up blocked. The last case chains
+            # along the row, so a cell is blocked when some cell to its left (or the fixed
+            # boundary cell) is blocked and every cell in between has exactly 5.
+            starts = row[:, 1:-1] | (counts >= 6)
+            chains = counts == 5
+            start_at = np.where(starts, positions, -2)
+            start_at = np.concatenate((np.where(row[:, :1], -1, -2), start_at), axis=1)
+            break_at = np.where(~chains, positions, -1)
+            break_at = np.concatenate((np.full((maps, 1), -1), break_at), axis=1)
+            last_start = np.maximum.accumulate(start_at, axis=1)[:, 1:]
+            last_break = np.maximum.accumulate(break_at, axis=1)[:, 1:]
+            row[:, 1:-1] = (last_start >= -1) & (last_break <= last_start)
+
+
+# Generate a stack of count maze grids (count, rows, cols) with 1 for unblocked and 0 for
+# blocked cells, drawing them one after another from the same random source
+def generate_mazes(count, rows, cols, density=0.1, seed=None):
+    random = _random_state(seed)
+    walls = np.zeros((count, rows, cols), dtype=bool)
+
+    # Create random walls
+    num_walls = int(rows * cols * density)
+    for k in range(count):
+        wall_rows, wall_cols = _random_cells(random, num_walls, rows, cols)
+        walls[k, wall_rows, wall_cols] = True
+
+    # Smooth the walls to create a maze-like pattern
+    _smooth_walls(walls)
+    return (~walls).astype(np.int64)
+
+
+# Generate a maze-like pattern of obstacles
+def generate_maze(grid, density=0.1, seed=None):
+    rows, cols = grid.shape
+    grid[...] = generate_mazes(1, rows, cols, density, seed)[0]
+
+
+# Generate a random grid where each cell is unblocked with probability p_free
+def generate_random_grid(rows, cols, p_free=0.7, seed=None):
+    return _random_state(seed).choice([0, 1], size=(rows, cols), p=[1 - p_free, p_free])
@@ -0,0 +1,282 @@
+import heapq
+
+import numpy as np
+
+from .core import GridSearcher
+
+
+# Unit-cost distances from each source to each target cell of a block, -1 where unreachable.
+# All sources are flooded at once as layers of one boolean array.
+def _block_distances(free, sources, targets):
+    layers = len(sources)
+    rows, cols = free.shape
+    target_rows = [row for row, _ in targets]
+    target_cols = [col for _, col in targets]
+    dist = np.full((layers, len(targets)), -1, dtype=np.int32)
+
+    frontier = np.zeros((layers, rows, cols), dtype=bool)
+    frontier[np.arange(layers), [row for row, _ in sources], [col for _, col in sources]] = True
+    reached = frontier.copy()
+    dist[frontier[:, target_rows, target_cols]] = 0
+
+    step = 0
+    while frontier.any():
+        step += 1
+        grown = np.zeros_like(frontier)
+        grown[:, 1:, :] |= frontier[:, :-1, :]
+        grown[:, :-1, :] |= frontier[:, 1:, :]
+        grown[:, :, 1:] |= frontier[:, :, :-1]
+        grown[:, :, :-1] |= frontier[:, :, 1:]
+        grown &= free
+        grown &= ~reached
+        reached |= grown
+        dist[grown[:, target_rows, target_cols]] = step
+        frontier = grown
+    return dist
+
+
+# Hierarchical path planner (HPA*) for large 4-connected grids. The grid is split into square
+# clusters, entrances are placed where neighbouring clusters share free border cells and the
+# distances between the entrances of every cluster are precomputed. Queries search the small
+# abstract graph of entrances and then refine each hop with GridSearcher inside its cluster.
+# Paths are near-optimal: they always pass through entrance cells.
+class HierarchicalPlanner:
+    def __init__(self, grid, cluster_size=32):
+        self.free = np.asarray(grid) == 1
+        self.rows, self.cols = self.free.shape
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-self.rows // cluster_size)
+        self.cluster_cols = -(-self.cols // cluster_size)
+
+        # Entrance transitions of every border: key -> list of (cell, cell across the border)
+        self.borders = {}
+        # Abstract edges between entrances of neighbouring clusters (cost 1)
+        self.inter = {}
+        # Abstract edges inside each cluster: cluster -> {entrance: [(entrance, distance), ...]}
+        self.intra = {}
+
+        # Number of abstract nodes expanded by the last query
+        self.expanded = 0
+
+        for cluster_row in range(self.cluster_rows):
+            for cluster_col in range(self.cluster_cols):
+                if cluster_col + 1 < self.cluster_cols:
+                    self._build_border(('v', cluster_row, cluster_col))
+                if cluster_row + 1 < self.cluster_rows:
+                    self._build_border(('h', cluster_row, cluster_col))
+        for cluster_row in range(self.cluster_rows):
+            for cluster_col in range(self.cluster_cols):
+                self._build_cluster((cluster_row, cluster_col))
+
+    # Cluster (row, col) containing a cell
+    def cluster_of(self, row, col):
+        return row // self.cluster_size, col // self.cluster_size
+
+    # Row and column slices covering a cluster
+    def _cluster_window(self, cluster):
+        size = self.cluster_size
+        return (slice(cluster[0] * size, min((cluster[0] + 1) * size, self.rows)),
+                slice(cluster[1] * size, min((cluster[1] + 1) * size, self.cols)))
+
+    # Find the entrances along one border. 'v' borders separate a cluster from the one on its
+    # right and 'h' borders from the one below. Every maximal run of cells that are free on
+    # both sides gets one transition in its middle, or one at each end when it is long.
+    def _find_transitions(self, key):
+        kind, cluster_row, cluster_col = key
+        size = self.cluster_size
+        cols = self.cols
+        if kind == 'v':
+            first = cluster_row * size
+            line = (cluster_col + 1) * size - 1
+            last = min(first + size, self.rows)
+            both = self.free[first:last, line] & self.free[first:last, line + 1]
+        else:
+            first = cluster_col * size
+            line = (cluster_row + 1) * size - 1
+            last = min(first + size, self.cols)
+            both = self.free[line, first:last] & self.free[line + 1, first:last]
+
+        edges = np.diff(np.concatenate(([0], both.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        transitions = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            length = end - start
+            picks = [start + (length - 1) // 2] if length < 6 else [start, end - 1]
+            for pick in picks:
+                if kind == 'v':
+                    cell = (first + pick) * cols + line
+                    transitions.append((cell, cell + 1))
+                else:
+                    cell = line * cols + first + pick
+                    transitions.append((cell, cell + cols))
+        return transitions
+
+    # Recompute the entrances of one border and its inter-cluster edges
+    def _build_border(self, key):
+        inter = self.inter
+        for a, b in self.borders.get(key, ()):
+            for cell, other in ((a, b), (b, a)):
+                partners = inter.get(cell)
+                if partners is not None:
+                    partners.discard(other)
+                    if not partners:
+                        del inter[cell]
+
+        transitions = self._find_transitions(key)
+        self.borders[key] = transitions
+        for a, b in transitions:
+            inter.setdefault(a, set()).add(b)
+            inter.setdefault(b, set()).add(a)
+
+    # Keys of the borders around a cluster that exist in the grid
+    def _cluster_borders(self, cluster):
+        cluster_row, cluster_col = cluster
+        keys = [('v', cluster_row, cluster_col), ('v', cluster_row, cluster_col - 1),
+                ('h', cluster_row, cluster_col), ('h', cluster_row - 1, cluster_col)]
+        return [key for key in keys if key in self.borders]
+
+    # Entrance cells lying inside a cluster
+    def _cluster_entrances(self, cluster):
+        entrances = set()
+        for key in self._cluster_borders(cluster):
+            for a, b in self.borders[key]:
+                for cell in (a, b):
+                    if self.cluster_of(*divmod(cell, self.cols)) == cluster:
+                        entrances.add(cell)
+        return sorted(entrances)
+
+    # Recompute the distances between the entrances of one cluster
+    def _build_cluster(self, cluster):
+        entrances = self._cluster_entrances(cluster)
+        edges = {cell: [] for cell in entrances}
+        self.intra[cluster] = edges
+        if len(entrances) < 2:
+            return
+
+        dist = self._local_distances(cluster, entrances, entrances)
+        for k, cell in enumerate(entrances):
+            for m, other in enumerate(entrances):
+                d = int(dist[k, m])
+                if d > 0:
+                    edges[cell].append((other, d))
+
+    # Distances inside a cluster between lists of cells given as grid indices
+    def _local_distances(self, cluster, sources, targets):
+        row_slice, col_slice = self._cluster_window(cluster)
+        cols = self.cols
+
+        def local(cells):
+            return [(cell // cols - row_slice.start, cell % cols - col_slice.start) for cell in cells]
+
+        return _block_distances(self.free[row_slice, col_slice], local(sources), local(targets))
+
+    # Apply (row, col, value) changes, value being 1 for unblocked and 0 for blocked, and
+    # rebuild only the borders and clusters around the changed cells
+    def update_cells(self, changes):
+        dirty = set()
+        for row, col, value in changes:
+            self.free[row, col] = value == 1
+            dirty.add(self.cluster_of(row, col))
+
+        borders = set()
+        for cluster in dirty:
+            borders.update(self._cluster_borders(cluster))
+        for key in borders:
+            self._build_border(key)
+
+        # Clusters on the far side of a rebuilt border may have gained or lost entrances
+        clusters = set(dirty)
+        for kind, cluster_row, cluster_col in borders:
+            clusters.add((cluster_row, cluster_col))
+            clusters.add((cluster_row, cluster_col + 1) if kind == 'v' else (cluster_row + 1, cluster_col))
+        for cluster in clusters:
+            self._build_cluster(cluster)
+
+    # Search the abstract graph for the sequence of cells the path must pass through
+    def _abstract_search(self, start, target):
+        cols = self.cols
+        src_cluster = self.cluster_of(*divmod(start, cols))
+        dest_cluster = self.cluster_of(*divmod(target, cols))
+
+        # Temporary edges linking the endpoints to the entrances of their clusters
+        extra = {start: []}
+        src_targets = self._cluster_entrances(src_cluster)
+        if src_cluster == dest_cluster:
+            src_targets.append(target)
+        for entrance, d in zip(src_targets, self._local_distances(src_cluster, [start], src_targets)[0].tolist()):
+            if d > 0:
+                extra[start].append((entrance, d))
+        dest_entrances = self._cluster_entrances(dest_cluster)
+        for entrance, d in zip(dest_entrances, self._local_distances(dest_cluster, [target], dest_entrances)[0].tolist()):
+            if d > 0:
+                extra.setdefault(entrance, []).append((target, d))
+
+        target_row, target_col = divmod(target, cols)
+        g = {start: 0}
+        parent = {start: start}
+        closed = set()
+        open_list = [(0, start)]
+        expanded = 0
+        while open_list:
+            f, current = heapq.heappop(open_list)
+            if current in closed:
+                continue
+            closed.add(current)
+            expanded += 1
+            if current == target:
+                break
+
+            row, col = divmod(current, cols)
+            cluster = self.cluster_of(row, col)
+            neighbours = list(self.intra[cluster].get(current, ()))
+            neighbours.extend((other, 1) for other in self.inter.get(current, ()))
+            neighbours.extend(extra.get(current, ()))
+            for other, cost in neighbours:
+                if other in closed:
+                    continue
+                g_new = g[current] + cost
+                if g_new < g.get(other, g_new + 1):
+                    g[other] = g_new
+                    parent[other] = current
+                    other_row, other_col = divmod(other, cols)
+                    heapq.heappush(open_list, (g_new + abs(other_row - target_row) + abs(other_col - target_col), other))
+
+        self.expanded = expanded
+        if target not in closed:
+            return []
+        route = [target]
+        while parent[route[-1]] != route[-1]:
+            route.append(parent[route[-1]])
+        route.reverse()
+        return route
+
+    # Find a path from src to dest, returns None for invalid or blocked endpoints
+    # and an empty list when the destination cannot be reached
+    def search(self, src, dest):
+        for row, col in (src, dest):
+            if not (0 <= row < self.rows and 0 <= col < self.cols and self.free[row, col]):
+                return None
+        if src[0] == dest[0] and src[1] == dest[1]:
+            return [(src[0], src[1])]
+
+        cols = self.cols
+        route = self._abstract_search(src[0] * cols + src[1], dest[0] * cols + dest[1])
+        if not route:
+            return []
+
+        # Refine every hop: neighbouring cells across a border or a search inside one cluster
+        path = [(src[0], src[1])]
+        for a, b in zip(route, route[1:]):
+            a_row, a_col = divmod(a, cols)
+            b_row, b_col = divmod(b, cols)
+            if abs(a_row - b_row) + abs(a_col - b_col) == 1:
+                path.append((b_row, b_col))
+                continue
+            row_slice, col_slice = self._cluster_window(self.cluster_of(a_row, a_col))
+            block = GridSearcher(self.free[row_slice, col_slice].astype(np.uint8))
+            hop = block.search((a_row - row_slice.start, a_col - col_slice.start),
+                               (b_row - row_slice.start, b_col - col_slice.start))
+            path.extend((row + row_slice.start, col + col_slice.start) for row, col in hop[1:])
+        return path
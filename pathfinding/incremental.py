@@ -0,0 +1,179 @@
+import heapq
+from array import array
+
+import numpy as np
+
+from .core import DIRECTIONS_4, INF, SQRT2, _move_table
+
+
+# Persistent D* Lite planner. The search runs backwards from the goal and keeps its state
+# between calls, so when the robot discovers changed cells only the part of the search tree
+# affected by them is repaired instead of planning again from scratch. Steps cost like in
+# GridSearcher: 1, or diagonal_cost for diagonal steps, which without corner_cutting are only
+# allowed when both cells beside them are free.
+class DStarLitePlanner:
+    def __init__(self, grid, start, goal, directions=DIRECTIONS_4, diagonal_cost=SQRT2, corner_cutting=True):
+        cells = np.asarray(grid)
+        self.rows, self.cols = cells.shape
+        self.directions = tuple(directions)
+        self.diagonal = any(di != 0 and dj != 0 for di, dj in self.directions)
+        self.diagonal_cost = float(diagonal_cost)
+        self.corner_cutting = corner_cutting
+        self.moves = _move_table(self.directions, self.cols, self.diagonal_cost)
+        size = self.rows * self.cols
+
+        # Occupancy flattened row by row (1 for unblocked, 0 for blocked)
+        self.free = bytearray((cells == 1).astype(np.uint8).tobytes())
+
+        # Cost-to-goal estimates: g is the settled value and rhs the one-step lookahead
+        self.g = array('d', [INF]) * size
+        self.rhs = array('d', [INF]) * size
+
+        # Priority queue with lazy deletion, open_keys holds the valid key of every queued cell
+        self.open_list = []
+        self.open_keys = {}
+
+        self.start = start[0] * self.cols + start[1]
+        self.goal = goal[0] * self.cols + goal[1]
+        self.last_start = self.start
+        self.key_modifier = 0.0
+
+        # Number of cells expanded by the last plan or update
+        self.expanded = 0
+
+        self.rhs[self.goal] = 0.0
+        self._push(self.goal, self._calculate_key(self.goal))
+
+    # Heuristic distance between two cell indices (Manhattan, or octile with diagonals)
+    def _h(self, a, b):
+        a_row, a_col = divmod(a, self.cols)
+        b_row, b_col = divmod(b, self.cols)
+        d_row = abs(a_row - b_row)
+        d_col = abs(a_col - b_col)
+        if self.diagonal:
+            return d_row + d_col + (self.diagonal_cost - 2.0) * min(d_row, d_col)
+        return d_row + d_col
+
+    def _calculate_key(self, cell):
+        best = min(self.g[cell], self.rhs[cell])
+        return (best + self._h(self.start, cell) + self.key_modifier, best)
+
+    def _push(self, cell, key):
+        self.open_keys[cell] = key
+        heapq.heappush(self.open_list, (key, cell))
+
+    # Drop stale entries and return the smallest valid key
+    def _top_key(self):
+        open_list = self.open_list
+        open_keys = self.open_keys
+        while open_list:
+            key, cell = open_list[0]
+            if open_keys.get(cell) == key:
+                return key
+            heapq.heappop(open_list)
+        return (INF, INF)
+
+    # Free neighbours of a cell as (cell, step cost) pairs
+    def _neighbours(self, cell):
+        rows = self.rows
+        cols = self.cols
+        free = self.free
+        i, j = divmod(cell, cols)
+        for di, dj, offset, step, _ in self.moves:
+            new_i = i + di
+            new_j = j + dj
+            if 0 <= new_i < rows and 0 <= new_j < cols and free[cell + offset]:
+                # Without corner cutting a diagonal step needs both cells beside it free
+                if di and dj and not self.corner_cutting and not (free[cell + di * cols] and free[cell + dj]):
+                    continue
+                yield cell + offset, step
+
+    def _update_vertex(self, cell):
+        if cell != self.goal:
+            best = INF
+            if self.free[cell]:
+                g = self.g
+                for other, step in self._neighbours(cell):
+                    if g[other] + step < best:
+                        best = g[other] + step
+            self.rhs[cell] = best
+
+        self.open_keys.pop(cell, None)
+        if self.g[cell] != self.rhs[cell]:
+            self._push(cell, self._calculate_key(cell))
+
+    def _compute_shortest_path(self):
+        g = self.g
+        rhs = self.rhs
+        start = self.start
+        expanded = 0
+        while self._top_key() < self._calculate_key(start) or rhs[start] != g[start]:
+            key_old, cell = heapq.heappop(self.open_list)
+            del self.open_keys[cell]
+            expanded += 1
+
+            key_new = self._calculate_key(cell)
+            if key_old < key_new:
+                self._push(cell, key_new)
+            elif g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+                for other, _ in self._neighbours(cell):
+                    self._update_vertex(other)
+            else:
+                g[cell] = INF
+                self._update_vertex(cell)
+                for other, _ in self._neighbours(cell):
+                    self._update_vertex(other)
+        self.expanded = expanded
+
+    # Follow the cheapest neighbours from the start to the goal
+    def _extract_path(self):
+        cols = self.cols
+        g = self.g
+        if not self.free[self.start] or g[self.start] == INF:
+            return []
+
+        cell = self.start
+        path = [divmod(cell, cols)]
+        for _ in range(self.rows * self.cols):
+            if cell == self.goal:
+                return path
+            cell = min(self._neighbours(cell), key=lambda move: g[move[0]] + move[1])[0]
+            path.append(divmod(cell, cols))
+        return []
+
+    # Plan (or re-read) the path from the current start to the goal
+    def plan(self):
+        self._compute_shortest_path()
+        return self._extract_path()
+
+    # Apply (row, col, value) changes seen by the robot, value being 1 for unblocked and 0 for
+    # blocked, move the start to the robot's position and repair the path
+    def update(self, changes, position=None):
+        if position is not None:
+            self.start = position[0] * self.cols + position[1]
+            self.key_modifier += self._h(self.last_start, self.start)
+            self.last_start = self.start
+
+        cols = self.cols
+        touched = set()
+        for row, col, value in changes:
+            cell = row * cols + col
+            free = 1 if value == 1 else 0
+            if self.free[cell] == free:
+                continue
+            self.free[cell] = free
+            touched.add(cell)
+
+            # Every edge into or out of the cell changed cost, and without corner cutting so
+            # did the diagonal edges passing beside it, which join its neighbours
+            i, j = row, col
+            for di, dj in self.directions:
+                new_i = i + di
+                new_j = j + dj
+                if 0 <= new_i < self.rows and 0 <= new_j < cols:
+                    touched.add(new_i * cols + new_j)
+
+        for cell in touched:
+            self._update_vertex(cell)
+        return self.plan()
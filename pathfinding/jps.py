@@ -0,0 +1,251 @@
+import heapq
+from array import array
+
+import numpy as np
+
+from .core import DIRECTIONS_4, INF, SQRT2, run_search
+
+
+# Horizontal jump distances from every cell of a padded boolean occupancy array, jumping
+# towards higher columns: n > 0 when the jump stops at a cell with a forced neighbour n cells
+# away, -n when the n-th cell is blocked. Flip the columns for jumps to the left.
+def _horizontal_jumps(walkable):
+    rows, width = walkable.shape
+    forced = np.zeros_like(walkable)
+    forced[1:-1, 1:] = walkable[1:-1, 1:] & ((walkable[:-2, 1:] & ~walkable[:-2, :-1])
+                                             | (walkable[2:, 1:] & ~walkable[2:, :-1]))
+
+    # Column of the first blocked or forced cell after every cell
+    columns = np.arange(width)
+    stops = np.where(~walkable | forced, columns, width)
+    first = np.minimum.accumulate(stops[:, ::-1], axis=1)[:, ::-1]
+    following = np.full((rows, width), width)
+    following[:, :-1] = first[:, 1:]
+
+    distance = following - columns
+    lands = np.take_along_axis(walkable, np.minimum(following, width - 1), axis=1)
+    return np.where(lands, distance, -distance).astype(np.int32)
+
+
+# Jump Point Search for uniform-cost grids. Instead of pushing every neighbour it jumps along
+# straight (and diagonal) lines and only stops at cells where the optimal path may turn.
+# With 4 directions every step costs 1. With 8 directions diagonal steps cost sqrt(2) and
+# may not cut the corner of a blocked cell.
+class JumpPointSearcher:
+    def __init__(self, grid, directions=DIRECTIONS_4):
+        cells = np.asarray(grid)
+        self.rows, self.cols = cells.shape
+        self.diagonal = any(di != 0 and dj != 0 for di, dj in directions)
+
+        # Occupancy with a one-cell blocked border so jumps never need bounds checks
+        self.width = self.cols + 2
+        padded = np.zeros((self.rows + 2, self.width), dtype=np.uint8)
+        padded[1:-1, 1:-1] = cells == 1
+        self.walk = bytearray(padded.tobytes())
+
+        # Precomputed horizontal jumps, see _horizontal_jumps. A 4-connected vertical jump
+        # checks both sides at every cell, the tables answer those checks in O(1).
+        walkable = padded == 1
+        self.jump_right = array('i', _horizontal_jumps(walkable).tobytes())
+        self.jump_left = array('i', _horizontal_jumps(walkable[:, ::-1])[:, ::-1].tobytes())
+
+        size = len(self.walk)
+        self.g = array('d', [INF]) * size
+        self.parent = array('q', [-1]) * size
+        self.stamp = array('Q', [0]) * size
+        self.open_mark = 0
+        self.closed_mark = 0
+        self.goal = -1
+        self.goal_row = -1
+
+        # Number of jump points expanded by the last query
+        self.expanded = 0
+
+    # Invalidate the state left behind by the previous query
+    def reset(self):
+        self.open_mark = self.closed_mark + 1
+        self.closed_mark = self.open_mark + 1
+
+    # Check if a cell is inside the grid and unblocked
+    def is_free(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.walk[(row + 1) * self.width + col + 1] == 1
+
+    # Jump horizontally (step is +1 or -1) until a blocked cell, the goal or a forced neighbour
+    def _jump_horizontal(self, node, step):
+        distance = (self.jump_right if step == 1 else self.jump_left)[node]
+        if node // self.width == self.goal_row:
+            ahead = (self.goal - node) * step
+            if 0 < ahead and (ahead <= distance or ahead < -distance):
+                return self.goal
+        return node + distance * step if distance > 0 else -1
+
+    # Jump vertically (step is +width or -width). On 4-connected grids a vertical jump also
+    # stops where a horizontal jump from the current cell would find a jump point.
+    def _jump_vertical(self, node, step):
+        walk = self.walk
+        goal = self.goal
+        check_sides = not self.diagonal
+        while True:
+            node += step
+            if not walk[node]:
+                return -1
+            if node == goal:
+                return node
+            if (walk[node - 1] and not walk[node - 1 - step]) or (walk[node + 1] and not walk[node + 1 - step]):
+                return node
+            if check_sides and (self._jump_horizontal(node, 1) != -1 or self._jump_horizontal(node, -1) != -1):
+                return node
+
+    # Jump diagonally, stopping where one of the straight jumps from the current cell succeeds
+    def _jump_diagonal(self, node, step_row, step_col):
+        walk = self.walk
+        goal = self.goal
+        step = step_row + step_col
+        while True:
+            # Diagonal moves may not cut corners, both orthogonal cells must be free
+            if not (walk[node + step_row] and walk[node + step_col]):
+                return -1
+            node += step
+            if not walk[node]:
+                return -1
+            if node == goal:
+                return node
+            if self._jump_horizontal(node, step_col) != -1 or self._jump_vertical(node, step_row) != -1:
+                return node
+
+    # Directions (row step, col step) worth jumping in from a node reached from parent
+    def _pruned_directions(self, node, parent):
+        walk = self.walk
+        width = self.width
+        if parent == node:
+            # The start node explores every legal direction
+            steps = [(0, 1), (0, -1), (width, 0), (-width, 0)]
+            if self.diagonal:
+                steps += [(width, 1), (width, -1), (-width, 1), (-width, -1)]
+            return steps
+
+        node_row, node_col = divmod(node, width)
+        parent_row, parent_col = divmod(parent, width)
+        step_row = width * ((node_row > parent_row) - (node_row < parent_row))
+        step_col = (node_col > parent_col) - (node_col < parent_col)
+
+        if step_row and step_col:
+            steps = [(step_row, 0), (0, step_col)]
+            if walk[node + step_row] and walk[node + step_col]:
+                steps.append((step_row, step_col))
+            return steps
+
+        # Straight moves keep going forward and may turn towards either side
+        if step_col:
+            sides = (width, -width)
+            steps = [(0, step_col)]
+            side_steps = [(side, 0) for side in sides]
+            diagonal_steps = [(side, step_col) for side in sides if walk[node + side] and walk[node + step_col]]
+        else:
+            sides = (1, -1)
+            steps = [(step_row, 0)]
+            side_steps = [(0, side) for side in sides]
+            diagonal_steps = [(step_row, side) for side in sides if walk[node + side] and walk[node + step_row]]
+        if self.diagonal:
+            steps += diagonal_steps
+        return steps + side_steps
+
+    # Jump from node in the given direction, returns the jump point or -1
+    def _jump(self, node, step_row, step_col):
+        if step_row and step_col:
+            return self._jump_diagonal(node, step_row, step_col)
+        if step_col:
+            return self._jump_horizontal(node, step_col)
+        return self._jump_vertical(node, step_row)
+
+    # Distance between two padded indices, octile with diagonals and Manhattan without
+    def _distance(self, a, b):
+        a_row, a_col = divmod(a, self.width)
+        b_row, b_col = divmod(b, self.width)
+        d_row = abs(a_row - b_row)
+        d_col = abs(a_col - b_col)
+        if self.diagonal:
+            return max(d_row, d_col) + (SQRT2 - 1.0) * min(d_row, d_col)
+        return d_row + d_col
+
+    # Expand the jump points into the full list of (row, col) cells from source to destination
+    def trace_path(self, index):
+        width = self.width
+        parent = self.parent
+        jump_points = [index]
+        while parent[index] != index:
+            index = parent[index]
+            jump_points.append(index)
+        jump_points.reverse()
+
+        row, col = divmod(jump_points[0], width)
+        path = [(row - 1, col - 1)]
+        for point in jump_points[1:]:
+            end_row, end_col = divmod(point, width)
+            step_row = (end_row > row) - (end_row < row)
+            step_col = (end_col > col) - (end_col < col)
+            while (row, col) != (end_row, end_col):
+                row += step_row
+                col += step_col
+                path.append((row - 1, col - 1))
+        return path
+
+    # Find a path from src to dest with the same return values as GridSearcher.search
+    def search(self, src, dest):
+        if not self.is_free(src[0], src[1]) or not self.is_free(dest[0], dest[1]):
+            return None
+
+        width = self.width
+        start = (int(src[0]) + 1) * width + int(src[1]) + 1
+        goal = (int(dest[0]) + 1) * width + int(dest[1]) + 1
+        if start == goal:
+            return [(src[0], src[1])]
+
+        self.reset()
+        self.goal = goal
+        self.goal_row = goal // width
+        open_mark = self.open_mark
+        closed_mark = self.closed_mark
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        distance = self._distance
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        g[start] = 0.0
+        parent[start] = start
+        stamp[start] = open_mark
+
+        open_list = [(0.0, start)]
+        expanded = 0
+
+        while open_list:
+            f, current = heappop(open_list)
+            if stamp[current] == closed_mark:
+                continue
+            stamp[current] = closed_mark
+            expanded += 1
+
+            if current == goal:
+                self.expanded = expanded
+                return self.trace_path(goal)
+
+            for step_row, step_col in self._pruned_directions(current, parent[current]):
+                point = self._jump(current, step_row, step_col)
+                if point == -1 or stamp[point] == closed_mark:
+                    continue
+                g_new = g[current] + distance(current, point)
+                if stamp[point] != open_mark or g[point] > g_new:
+                    stamp[point] = open_mark
+                    g[point] = g_new
+                    parent[point] = current
+                    heappush(open_list, (g_new + distance(point, goal), point))
+
+        self.expanded = expanded
+        return []
+
+
+# Run Jump Point Search with the same call signature and messages as a_star_search
+def jump_point_search(grid, src, dest, directions=DIRECTIONS_4):
+    return run_search(grid, src, dest, JumpPointSearcher(grid, directions).search)
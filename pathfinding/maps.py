@@ -0,0 +1,139 @@
+import struct
+
+import numpy as np
+
+# Hand-made 32x30 demo map used by main.py (1 for unblocked, 0 for blocked)
+DEMO_GRID = [
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    [1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1],
+    [1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1],
+    [1, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1],
+    [1, 0, 1, 0, 1, 1, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0, 0, 1],
+    [1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    [1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1],
+    [1, 1, 0, 1, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1],
+    [1, 0, 1, 1, 0, 0, 1, 0, 1, 1, 1, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 0, 0, 1],
+    [1, 0, 0, 1, 0, 1, 0, 0, 0, 1, 1, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 1],
+    [1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 0, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1],
+    [1, 0, 0, 0, 0, 0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 1, 1],
+    [1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1],
+    [1, 0, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1],
+    [1, 1, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1],
+    [1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 1, 0, 1, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1],
+    [1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 0, 1, 1, 0, 1],
+    [1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, 1, 0, 0, 0, 1, 1, 0, 0, 0, 1, 1, 0, 1, 1, 0, 1, 1],
+    [1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1, 0, 0, 1, 0, 0, 1, 1],
+    [1, 1, 1, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1],
+    [1, 0, 0, 1, 1, 0, 0, 1, 1, 1, 0, 1, 0, 1, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 0, 1, 1, 0, 1, 1],
+    [1, 1, 1, 0, 1, 1, 0, 0, 0, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1, 0, 0, 1],
+    [1, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+    [1, 0, 1, 1, 1, 1, 0, 1, 0, 0, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 1, 0, 1],
+    [1, 0, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 1],
+    [1, 1, 1, 1, 0, 0, 0, 1, 1, 1, 0, 1, 1, 1, 1, 0, 0, 1, 0, 0, 1, 0, 1, 0, 1, 1, 0, 1, 1, 1],
+    [1, 1, 0, 0, 1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1],
+    [1, 1, 1, 1, 0, 1, 1, 1, 0, 0, 0, 1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 1, 0, 1, 1, 1, 1],
+    [1, 0, 1, 1, 0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1],
+    [1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1, 1],
+    [1, 1, 0, 1, 1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1, 1, 0, 0, 1, 1, 1, 1],
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+]
+
+
+# Binary map files start with a 16-byte header: the magic bytes, the format version, a flags
+# byte (bit 0 set when rows are bit-packed), two reserved bytes and the row and column counts
+# as little-endian uint32. The cells follow row by row, one uint8 per cell (1 for unblocked,
+# 0 for blocked) or, when packed, 8 cells per byte with every row padded to a whole byte.
+MAP_MAGIC = b'RPVM'
+MAP_VERSION = 1
+MAP_HEADER = struct.Struct('<4sBBHII')
+MAP_PACKED = 1
+
+
+# Write a grid to a binary map file, bit-packed when packed is set
+def save_map(filename, grid, packed=False):
+    cells = (np.asarray(grid) == 1).astype(np.uint8)
+    rows, cols = cells.shape
+    with open(filename, 'wb') as f:
+        f.write(MAP_HEADER.pack(MAP_MAGIC, MAP_VERSION, MAP_PACKED if packed else 0, 0, rows, cols))
+        (np.packbits(cells, axis=1) if packed else cells).tofile(f)
+
+
+# Read the header of a binary map file as (rows, cols, packed)
+def read_map_header(filename):
+    with open(filename, 'rb') as f:
+        header = f.read(MAP_HEADER.size)
+    if len(header) < MAP_HEADER.size:
+        raise ValueError(f"{filename} is too short to be a map file")
+    magic, version, flags, _, rows, cols = MAP_HEADER.unpack(header)
+    if magic != MAP_MAGIC:
+        raise ValueError(f"{filename} is not a map file")
+    if version != MAP_VERSION:
+        raise ValueError(f"unsupported map file version {version}")
+    return rows, cols, bool(flags & MAP_PACKED)
+
+
+# Load a binary map file. Unpacked files are memory-mapped into a (rows, cols) uint8 view
+# that GridSearcher shares as its occupancy instead of copying it. The searcher still reads
+# the whole map once to check it and build its neighbour masks, and allocates about 25 bytes
+# per cell for its masks and search buffers.
+# The default copy-on-write mode keeps cell updates in memory; pass mode='r+' to write them
+# back to the file. Bit-packed files are smaller on disk and are unpacked into memory.
+def load_map(filename, mode='c'):
+    rows, cols, packed = read_map_header(filename)
+    if packed:
+        data = np.memmap(filename, dtype=np.uint8, mode='r', offset=MAP_HEADER.size, shape=(rows, -(-cols // 8)))
+        return np.unpackbits(np.asarray(data), axis=1, count=cols)
+    return np.memmap(filename, dtype=np.uint8, mode=mode, offset=MAP_HEADER.size, shape=(rows, cols))
+
+
+# Read the next whitespace-separated header token of a PGM file, skipping # comments
+def _pgm_token(f):
+    token = b''
+    while True:
+        char = f.read(1)
+        if char == b'#':
+            f.readline()
+            if token:
+                return token
+        elif not char or char.isspace():
+            if token or not char:
+                return token
+        else:
+            token += char
+
+
+# Import a PGM image (binary P5 or plain P2) as a grid. Pixels brighter than threshold times
+# the maximum value are unblocked, like the white free space of occupancy map images.
+def import_pgm(filename, threshold=0.5):
+    with open(filename, 'rb') as f:
+        kind = _pgm_token(f)
+        if kind not in (b'P5', b'P2'):
+            raise ValueError(f"{filename} is not a PGM image")
+        cols, rows, maxval = int(_pgm_token(f)), int(_pgm_token(f)), int(_pgm_token(f))
+        if kind == b'P2':
+            pixels = np.array(f.read().split(), dtype=np.int64)[:rows * cols].reshape(rows, cols)
+        else:
+            offset = f.tell()
+    if kind == b'P5':
+        dtype = np.uint8 if maxval < 256 else np.dtype('>u2')
+        pixels = np.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=(rows, cols))
+    return (pixels > threshold * maxval).astype(np.uint8)
+
+
+# Import a PNG (or any image matplotlib can read) as a grid, averaging colour channels.
+# Pixels brighter than threshold (0 to 1) are unblocked.
+def import_image(filename, threshold=0.5):
+    from matplotlib.image import imread
+
+    pixels = imread(filename)
+    if pixels.dtype == np.uint8:
+        pixels = pixels / 255.0
+    if pixels.ndim == 3:
+        pixels = pixels[..., :3].mean(axis=2)
+    return (pixels > threshold).astype(np.uint8)
+
+
+# Import a CSV file of 1 (unblocked) and 0 (blocked) cells as a grid
+def import_csv(filename, delimiter=','):
+    cells = np.loadtxt(filename, delimiter=delimiter, dtype=np.int64, ndmin=2)
+    return (cells == 1).astype(np.uint8)
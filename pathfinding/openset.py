@@ -0,0 +1,71 @@
+from heapq import heappop, heappush
+
+
+# Open sets used by GridSearcher. Both take (priority, cell) pushes and pop the cell with the
+# lowest priority, or -1 once they are empty. A cell pushed again with a better priority
+# leaves its old entry behind, the searches skip those stale entries when they pop a cell
+# that is already closed.
+
+
+# Binary heap of (priority, cell) tuples for fractional priorities
+class HeapOpenSet:
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, priority, cell):
+        heappush(self.heap, (priority, cell))
+
+    def pop(self):
+        if not self.heap:
+            return -1
+        return heappop(self.heap)[1]
+
+
+# Bucket queue for whole-number priorities: one list of cells per priority (created on first
+# use) and a pointer to the lowest bucket that may hold cells. With a consistent heuristic
+# priorities never drop below the last popped one, so pops only move the pointer forward.
+# Each bucket is a small heap, so cells with equal priority come out lowest index first and
+# the pops follow the same (priority, cell) order as HeapOpenSet and the original
+# a_star_search, which keeps their paths.
+class BucketOpenSet:
+    def __init__(self):
+        self.buckets = []
+        self.current = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, priority, cell):
+        priority = int(priority)
+        buckets = self.buckets
+        if priority >= len(buckets):
+            buckets.extend([None] * (2 * priority + 1 - len(buckets)))
+        bucket = buckets[priority]
+        if bucket is None:
+            buckets[priority] = [cell]
+        else:
+            heappush(bucket, cell)
+        if priority < self.current:
+            self.current = priority
+        self.count += 1
+
+    def pop(self):
+        if not self.count:
+            return -1
+        buckets = self.buckets
+        current = self.current
+        while not buckets[current]:
+            current += 1
+        self.current = current
+        self.count -= 1
+        return heappop(buckets[current])
+
+
+# Pick the open set for a cost model: a bucket queue when every priority is a whole number,
+# a heap otherwise
+def make_open_set(integer_priorities):
+    return BucketOpenSet() if integer_priorities else HeapOpenSet()
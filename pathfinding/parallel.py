@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .batch import search_many
+from .connectivity import ConnectivityIndex
+from .core import DIRECTIONS_4, GridSearcher
+
+# Per-process state, set up once by _init_worker when a worker starts
+_worker_memory = None
+_worker_searcher = None
+
+
+# Attach the worker to the shared grid and build its search buffers
+def _init_worker(name, shape, dtype, directions):
+    global _worker_memory, _worker_searcher
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    grid = np.ndarray(shape, dtype=dtype, buffer=_worker_memory.buf)
+    _worker_searcher = GridSearcher(grid, directions, ConnectivityIndex(grid, directions))
+
+
+# Solve one chunk of (src, dest) queries inside a worker
+def _solve_chunk(pairs):
+    return list(search_many(_worker_searcher, pairs))
+
+
+# Plan batches of routes on a pool of worker processes that share one copy of the grid
+class ParallelPlanner:
+    def __init__(self, grid, workers=None, chunk_size=64, directions=DIRECTIONS_4):
+        grid = np.ascontiguousarray(grid)
+        self.chunk_size = chunk_size
+
+        # Copy the grid once into shared memory, workers map it instead of receiving it pickled
+        self._memory = shared_memory.SharedMemory(create=True, size=max(grid.nbytes, 1))
+        shared_grid = np.ndarray(grid.shape, dtype=grid.dtype, buffer=self._memory.buf)
+        shared_grid[:] = grid
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._memory.name, grid.shape, grid.dtype.str, tuple(directions)),
+        )
+
+    # Yield the paths of all queries in input order, solving chunks of them in parallel
+    def search_many(self, pairs, chunk_size=None):
+        chunk_size = chunk_size or self.chunk_size
+        pairs = list(pairs)
+        chunks = [pairs[k:k + chunk_size] for k in range(0, len(pairs), chunk_size)]
+        for paths in self._executor.map(_solve_chunk, chunks):
+            yield from paths
+
+    # Stop the workers and release the shared grid
+    def close(self):
+        self._executor.shutdown()
+        self._memory.close()
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
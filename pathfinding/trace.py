@@ -0,0 +1,76 @@
+from array import array
+
+import numpy as np
+
+
+# Recorder of the cells a search pushes onto its open list and expands, in the order it
+# happens. Events go into one preallocated array of cell indices (row * cols + col), pushes
+# stored as the index and expansions as ~index, and the array only grows by doubling when a
+# search outruns it. Attach one to GridSearcher (or pass trace= to a_star_search) to record.
+class SearchTrace:
+    def __init__(self, capacity=1 << 16):
+        self.events = array('q', [0]) * capacity
+        self.count = 0
+        self.rows = 0
+        self.cols = 0
+
+    # Forget the previous search, the buffer is kept
+    def start(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.count = 0
+
+    def _grow(self):
+        self.events.extend(array('q', [0]) * len(self.events))
+
+    # Record a cell added to (or improved in) the open list
+    def push(self, cell):
+        if self.count == len(self.events):
+            self._grow()
+        self.events[self.count] = cell
+        self.count += 1
+
+    # Record a cell taken off the open list and expanded
+    def expand(self, cell):
+        if self.count == len(self.events):
+            self._grow()
+        self.events[self.count] = ~cell
+        self.count += 1
+
+    # Recorded events as a NumPy view, cell index for pushes and ~index for expansions
+    def as_array(self):
+        return np.frombuffer(self.events, dtype=np.int64, count=self.count)
+
+    # Expanded cells as (row, col) rows of an array, in expansion order
+    def expansion_order(self):
+        events = self.as_array()
+        cells = ~events[events < 0]
+        return np.stack(np.divmod(cells, self.cols), axis=1)
+
+    # Event number at which every cell was first pushed and expanded, -1 where it never was
+    def event_maps(self):
+        events = self.as_array()
+        size = self.rows * self.cols
+        pushed = np.full(size, -1, dtype=np.int64)
+        expanded = np.full(size, -1, dtype=np.int64)
+        steps = np.arange(len(events))
+        is_expansion = events < 0
+
+        # Assigning in reverse leaves the earliest event of every cell
+        pushed[events[~is_expansion][::-1]] = steps[~is_expansion][::-1]
+        expanded[~events[is_expansion][::-1]] = steps[is_expansion][::-1]
+        return pushed.reshape(self.rows, self.cols), expanded.reshape(self.rows, self.cols)
+
+    # Expansion order of every cell (0 for the first expanded cell), -1 where never expanded
+    def expansion_map(self):
+        events = self.as_array()
+        cells = ~events[events < 0]
+        order = np.full(self.rows * self.cols, -1, dtype=np.int64)
+        order[cells[::-1]] = np.arange(len(cells))[::-1]
+        return order.reshape(self.rows, self.cols)
+
+    # Number of times every cell was pushed onto the open list
+    def push_counts(self):
+        events = self.as_array()
+        counts = np.bincount(events[events >= 0], minlength=self.rows * self.cols)
+        return counts.reshape(self.rows, self.cols)
@@ -0,0 +1,323 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+# Define colors for visualization
+UNBLOCKED_COLOR = '#FFFF99'  # Light Yellow
+BLOCKED_COLOR = '#696969'  # Dim Gray
+START_COLOR = '#228B22'  # Forest Green
+END_COLOR = '#FF6347'  # Tomato
+
+
+# Show the grid and let the user pick the start (left click) and end (right click) points
+def select_points(grid, figsize=(12, 12), axis_labels=True, axis_off=False):
+    points = {'start': None, 'end': None}
+
+    # Handle mouse click events for selecting start and end points
+    def onclick(event):
+        if event.xdata is None or event.ydata is None:
+            return
+        col = int(event.xdata + 0.5)
+        row = int(event.ydata + 0.5)
+
+        if event.button == 1:  # Left mouse button for start point
+            points['start'] = [row, col]
+            print("Start point selected:", points['start'])
+        elif event.button == 3:  # Right mouse button for end point
+            points['end'] = [row, col]
+            print("End point selected:", points['end'])
+
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.imshow(grid, cmap='binary', interpolation='nearest')
+    ax.set_title('Select Start and End Points (Left click for start, Right click for end)')
+    if axis_labels:
+        ax.set_xlabel('Column Index')
+        ax.set_ylabel('Row Index')
+    if axis_off:
+        ax.axis('off')
+    else:
+        ax.invert_yaxis()
+
+    # Connect mouse click event
+    fig.canvas.mpl_connect('button_press_event', onclick)
+    plt.tight_layout()
+    plt.show()
+
+    return points['start'], points['end']
+
+
+# Show the grid with the path, source and destination marked as separate values
+def show_path_overlay(grid, path, src, dest):
+    grid_with_path = np.array(grid)
+
+    for row, col in path:
+        grid_with_path[row][col] = 2  # Mark the path with value 2
+
+    grid_with_path[src[0]][src[1]] = 3  # Mark the source with value 3
+    grid_with_path[dest[0]][dest[1]] = 4  # Mark the destination with value 4
+
+    plt.imshow(grid_with_path, cmap='viridis', interpolation='nearest')
+    plt.title('A* Pathfinding')
+    plt.gca().invert_yaxis()  # Invert the y-axis to fix the display orientation
+    plt.show()
+
+
+# Show the grid with the path drawn as red lines, optionally only at turns and the last step
+def show_path_lines(grid, path, src, dest, corners_only=False):
+    fig, ax = plt.subplots(figsize=(12, 12))
+
+    # Plot the grid with colors
+    ax.imshow(grid, cmap='binary', interpolation='nearest')
+
+    # Plot the path
+    for i in range(1, len(path)):
+        turn = path[i][0] != path[i-1][0] and path[i][1] != path[i-1][1]
+        if not corners_only or turn or i == len(path) - 1:
+            ax.plot([path[i-1][1], path[i][1]], [path[i-1][0], path[i][0]], color='red')
+
+    # Mark the start and end points with labels
+    ax.text(src[1], src[0], 'Start', color=START_COLOR, fontsize=12, ha='center')
+    ax.text(dest[1], dest[0], 'End', color=END_COLOR, fontsize=12, ha='center')
+
+    # Add title and axis labels
+    ax.set_title('A* Pathfinding Visualization')
+    ax.set_xlabel('Column Index')
+    ax.set_ylabel('Row Index')
+
+    # Show the plot
+    ax.invert_yaxis()  # Invert the y-axis to fix the display orientation
+    plt.tight_layout()
+    plt.show()
+
+
+# Show the grid with the path drawn as arrows along a colour gradient
+def show_path_arrows(grid, path, src, dest, discrete_colors=True):
+    fig, ax = plt.subplots(figsize=(12, 12))
+
+    # Define a gradient of colors for path visualization
+    cmap = plt.get_cmap('cool', len(path)) if discrete_colors else plt.get_cmap('cool')
+
+    # Plot the path
+    for i in range(1, len(path)):
+        ax.arrow(path[i-1][1], path[i-1][0], path[i][1] - path[i-1][1], path[i][0] - path[i-1][0],
+                 head_width=0.2, head_length=0.2, fc=cmap(i), ec=cmap(i))
+
+    # Mark the start and end points with labels
+    ax.text(src[1], src[0], 'Start', color=START_COLOR, fontsize=12, ha='center')
+    ax.text(dest[1], dest[0], 'End', color=END_COLOR, fontsize=12, ha='center')
+
+    # Plot the grid with colors
+    ax.imshow(grid, cmap='binary', interpolation='nearest')
+
+    # Add title and axis labels
+    ax.set_title('A* Pathfinding Visualization')
+    ax.set_xlabel('Column Index')
+    ax.set_ylabel('Row Index')
+
+    # Show the plot
+    ax.invert_yaxis()  # Invert the y-axis to fix the display orientation
+    plt.tight_layout()
+    plt.show()
+
+
+# Show the path with varying colors, dashing the segments where the robot drifts more than one cell
+def show_path_drift(grid, path, src, dest):
+    # Create a colormap for the path with drift
+    cmap = plt.get_cmap('cool')
+
+    # Create figure and axes
+    fig, ax = plt.subplots(figsize=(10, 10))
+
+    # Hide the axes
+    ax.axis('off')
+
+    # Display the grid without numbers and black lines
+    ax.imshow(grid, cmap='binary', interpolation='nearest')
+
+    # Plot the path with varying colors and introduce drift in path visualization
+    for i in range(len(path) - 1):
+        start = path[i]
+        end = path[i + 1]
+        # Check if the path has a normal right turn or a curved drift turn
+        if abs(start[0] - end[0]) <= 1 and abs(start[1] - end[1]) <= 1:
+            ax.plot([start[1], end[1]], [start[0], end[0]], color=cmap(i / len(path)), linewidth=2)
+        else:
+            ax.plot([start[1], end[1]], [start[0], end[0]], color=cmap(i / len(path)), linewidth=2, linestyle='dashed')
+
+    # Mark the start and end points with circles of varying sizes
+    ax.plot(src[1], src[0], 'go', markersize=15, alpha=0.8)  # Start point with green circle
+    ax.plot(dest[1], dest[0], 'ro', markersize=20, alpha=0.8)  # End point with red circle
+
+    # Add a title
+    ax.set_title('A* Pathfinding Visualization', fontsize=20, fontweight='bold')
+
+    # Show the plot
+    plt.show()
+
+
+# Render the grid and path straight to an image file (PNG, SVG, ... from the file extension)
+# without opening a window. The whole path is drawn as one solid and one dashed line
+# collection, coloured along the 'cool' gradient like show_path_drift, so the drawing cost
+# stays nearly flat as the path grows. rasterize keeps huge paths small in vector formats.
+def render_path(grid, path, src, dest, filename, figsize=(10, 10), dpi=100, rasterize=False):
+    fig = Figure(figsize=figsize, dpi=dpi)
+    ax = fig.add_subplot()
+    ax.axis('off')
+    ax.imshow(grid, cmap='binary', interpolation='nearest')
+
+    if len(path) > 1:
+        points = np.asarray(path, dtype=float)[:, ::-1]  # (x, y) = (col, row)
+        segments = np.stack((points[:-1], points[1:]), axis=1)
+        colors = plt.get_cmap('cool')(np.arange(len(segments)) / len(path))
+
+        # Steps of more than one cell are drift and drawn dashed
+        drift = np.abs(np.diff(points, axis=0)).max(axis=1) > 1
+        for mask, linestyle in ((~drift, 'solid'), (drift, 'dashed')):
+            if mask.any():
+                lines = LineCollection(segments[mask], colors=colors[mask], linewidths=2,
+                                       linestyles=linestyle, rasterized=rasterize)
+                ax.add_collection(lines)
+
+    # Mark the start and end points with circles of varying sizes
+    ax.plot(src[1], src[0], 'go', markersize=15, alpha=0.8)  # Start point with green circle
+    ax.plot(dest[1], dest[0], 'ro', markersize=20, alpha=0.8)  # End point with red circle
+    ax.set_title('A* Pathfinding Visualization', fontsize=20, fontweight='bold')
+
+    fig.savefig(filename)
+
+
+# Animate the robot moving along the path. The visited cells are one preallocated line of red
+# markers that every frame only updates, so with blitting the frames stay equally fast however
+# long the path is. step moves the robot several cells per frame, and duration (in seconds)
+# picks the step so that long paths are compressed into that running time. With a filename
+# the animation is written to a video (.gif with Pillow, anything else such as .mp4 with
+# ffmpeg) on an off-screen figure instead of being shown in a window.
+def animate_path(grid, path, src, dest, interval=500, step=1, duration=None, filename=None):
+    if duration is not None:
+        step = max(step, -(-len(path) * interval // int(duration * 1000)))
+    frames = list(range(step, len(path), step)) + [len(path)]
+
+    if filename is None:
+        fig, ax = plt.subplots(figsize=(12, 12))
+    else:
+        fig = Figure(figsize=(12, 12))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+    ax.set_title('A* Pathfinding Visualization')
+    ax.set_xlabel('Column Index')
+    ax.set_ylabel('Row Index')
+
+    # Initialize the grid plot
+    ax.imshow(grid, cmap='binary', interpolation='nearest')
+
+    cols = [col for _, col in path]
+    rows = [row for row, _ in path]
+    trail, = ax.plot([], [], linestyle='', marker='o', color='red', markersize=8, animated=filename is None)
+
+    def init():
+        trail.set_data([], [])
+        return trail,
+
+    # Function to update the animation
+    def update(frame):
+        trail.set_data(cols[:frame], rows[:frame])
+        return trail,
+
+    # Animate the pathfinding process
+    ani = FuncAnimation(fig, update, frames=frames, init_func=init, interval=interval,
+                        blit=True, repeat=False)
+    ax.invert_yaxis()  # Invert the y-axis to fix the display orientation
+    fig.tight_layout()
+
+    if filename is None:
+        plt.show()
+    else:
+        writer = 'pillow' if filename.lower().endswith('.gif') else 'ffmpeg'
+        ani.save(filename, writer=writer, fps=1000 / interval)
+
+
+# Image of a search trace after its first events: expanded cells coloured by expansion order,
+# cells still waiting on the open list in orange and everything else left transparent
+def _trace_image(pushed, expanded, events):
+    image = np.full(pushed.shape, np.nan)
+    frontier = (pushed >= 0) & (pushed < events)
+    image[frontier] = -1.0
+    explored = (expanded >= 0) & (expanded < events)
+    image[explored] = expanded[explored] / max(events, 1)
+    return image
+
+
+# Trace colours: expansion order along 'viridis', open cells in orange, untouched transparent
+def _trace_cmap():
+    cmap = plt.get_cmap('viridis').copy()
+    cmap.set_under('orange')
+    cmap.set_bad(alpha=0)
+    return cmap
+
+
+# Show the cells a traced search expanded as a heatmap of the expansion order, with the cells
+# left on the open list in orange and the path on top. With a filename the figure is written
+# to that file instead of being shown.
+def show_search_trace(grid, trace, path=None, filename=None):
+    pushed, expanded = trace.event_maps()
+
+    if filename is None:
+        fig, ax = plt.subplots(figsize=(12, 12))
+    else:
+        fig = Figure(figsize=(12, 12))
+        ax = fig.add_subplot()
+    ax.imshow(grid, cmap='binary', interpolation='nearest')
+    heatmap = ax.imshow(_trace_image(pushed, expanded, trace.count), cmap=_trace_cmap(),
+                        vmin=0, vmax=1, interpolation='nearest')
+    fig.colorbar(heatmap, ax=ax, label='Search progress')
+
+    if path:
+        ax.plot([col for _, col in path], [row for row, _ in path], color='red', linewidth=2)
+
+    ax.set_title(f'A* Search Trace ({len(trace.expansion_order())} cells expanded)')
+    ax.set_xlabel('Column Index')
+    ax.set_ylabel('Row Index')
+    ax.invert_yaxis()  # Invert the y-axis to fix the display orientation
+    fig.tight_layout()
+
+    if filename is None:
+        plt.show()
+    else:
+        fig.savefig(filename)
+
+
+# Replay a traced search: every frame plays step more events on a single preallocated image.
+# With a filename the replay is written to a video like animate_path.
+def animate_search_trace(grid, trace, step=50, interval=50, filename=None):
+    pushed, expanded = trace.event_maps()
+    frames = list(range(step, trace.count, step)) + [trace.count]
+
+    if filename is None:
+        fig, ax = plt.subplots(figsize=(12, 12))
+    else:
+        fig = Figure(figsize=(12, 12))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+    ax.imshow(grid, cmap='binary', interpolation='nearest')
+    heatmap = ax.imshow(_trace_image(pushed, expanded, 0), cmap=_trace_cmap(), vmin=0, vmax=1,
+                        interpolation='nearest', animated=filename is None)
+    ax.set_title('A* Search Trace')
+    ax.set_xlabel('Column Index')
+    ax.set_ylabel('Row Index')
+
+    def update(frame):
+        heatmap.set_data(_trace_image(pushed, expanded, frame))
+        return heatmap,
+
+    ani = FuncAnimation(fig, update, frames=frames, interval=interval, blit=True, repeat=False)
+    ax.invert_yaxis()  # Invert the y-axis to fix the display orientation
+    fig.tight_layout()
+
+    if filename is None:
+        plt.show()
+    else:
+        writer = 'pillow' if filename.lower().endswith('.gif') else 'ffmpeg'
+        ani.save(filename, writer=writer, fps=1000 / interval)
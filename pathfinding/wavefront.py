@@ -0,0 +1,153 @@
+import numpy as np
+
+from .core import DIRECTIONS_4, run_search
+
+# Shift amounts for the packed uint64 words
+ONE = np.uint64(1)
+HIGH_BIT = np.uint64(63)
+
+
+# Pack a boolean array into 64 columns per uint64 word, column c in bit c % 64 of word
+# c // 64. Padding columns are 0.
+def _pack(mask):
+    rows, cols = mask.shape
+    padded = np.zeros((rows, -(-cols // 64) * 64), dtype=bool)
+    padded[:, :cols] = mask
+    return np.packbits(padded, axis=1, bitorder='little').view('<u8')
+
+
+# Unpack words made by _pack back into a boolean array with cols columns
+def _unpack(bits, cols):
+    return np.unpackbits(bits.view(np.uint8), axis=1, bitorder='little', count=cols).view(bool)
+
+
+# Breadth-first wavefront over a boolean occupancy array for unit-cost 4-connected moves. The
+# frontier and the unvisited free cells are bit-packed 64 columns to a word, so each step
+# grows the whole frontier by one cell with a few shifts and masks, working only inside the
+# rows and words around the frontier. The step at which a cell is reached is recorded one
+# bit per plane, and the planes are unpacked into the int32 map of steps from src (-1 where
+# unreached) at the end. Stops early once dest is reached.
+def _wavefront(free, src, dest=None):
+    rows, cols = free.shape
+    unvisited = _pack(free)
+    words = unvisited.shape[1]
+    frontier = np.zeros_like(unvisited)
+    word, bit = divmod(src[1], 64)
+    frontier[src[0], word] = ONE << np.uint64(bit)
+    unvisited[src[0], word] &= ~frontier[src[0], word]
+    if dest is not None:
+        dest_word, dest_bit = divmod(dest[1], 64)
+        dest_mask = ONE << np.uint64(dest_bit)
+    top = bottom = src[0]
+    left = right = word
+
+    planes = []
+    step = 0
+    while True:
+        first_row, last_row = max(top - 1, 0), min(bottom + 2, rows)
+        first_word, last_word = max(left - 1, 0), min(right + 2, words)
+        window = (slice(first_row, last_row), slice(first_word, last_word))
+        current = frontier[window]
+
+        # Left and right moves shift bits within a word and carry the edge bit to the next
+        # word, up and down moves shift whole rows
+        grown = current << ONE
+        grown |= current >> ONE
+        grown[:, 1:] |= current[:, :-1] >> HIGH_BIT
+        grown[:, :-1] |= current[:, 1:] << HIGH_BIT
+        grown[1:, :] |= current[:-1, :]
+        grown[:-1, :] |= current[1:, :]
+        grown &= unvisited[window]
+        frontier[window] = grown
+        if not grown.any():
+            break
+
+        step += 1
+        unvisited[window] ^= grown
+        plane = 0
+        remaining = step
+        while remaining:
+            if plane == len(planes):
+                planes.append(np.zeros_like(unvisited))
+            if remaining & 1:
+                planes[plane][window] |= grown
+            remaining >>= 1
+            plane += 1
+        if dest is not None and frontier[dest[0], dest_word] & dest_mask:
+            break
+
+        grown_rows = np.flatnonzero(grown.any(axis=1))
+        grown_words = np.flatnonzero(grown.any(axis=0))
+        top, bottom = first_row + grown_rows[0], first_row + grown_rows[-1]
+        left, right = first_word + grown_words[0], first_word + grown_words[-1]
+
+    dist = np.zeros((rows, cols), dtype=np.int32)
+    for plane, bits in enumerate(planes):
+        dist |= _unpack(bits, cols).astype(np.int32) << plane
+    dist[~free | _unpack(unvisited, cols)] = -1
+    return dist
+
+
+# Number of unit steps from src to every cell of the grid (1 for unblocked, 0 for blocked)
+# with 4-connected moves, -1 where a cell cannot be reached
+def wavefront_distances(grid, src):
+    free = np.asarray(grid) == 1
+    if not free[src[0], src[1]]:
+        return np.full(free.shape, -1, dtype=np.int32)
+    return _wavefront(free, (src[0], src[1]))
+
+
+# Shortest-path engine for unit-cost 4-connected grids without a heap: a vectorized wavefront
+# from the source stops when it reaches the destination, then the path is walked back along
+# decreasing distances. Paths have the same length as a_star_search.
+class WavefrontSearcher:
+    def __init__(self, grid):
+        self.free = np.asarray(grid) == 1
+        self.rows, self.cols = self.free.shape
+
+        # Number of cells reached by the last query's wavefront
+        self.expanded = 0
+
+    # Check if a cell is inside the grid and unblocked
+    def is_free(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and bool(self.free[row, col])
+
+    # Apply (row, col, value) changes, value being 1 for unblocked and 0 for blocked
+    def update_cells(self, changes):
+        for row, col, value in changes:
+            self.free[row, col] = value == 1
+
+    # Find a path from src to dest with the same return values as GridSearcher.search
+    def search(self, src, dest):
+        if not self.is_free(src[0], src[1]) or not self.is_free(dest[0], dest[1]):
+            return None
+        src = (int(src[0]), int(src[1]))
+        dest = (int(dest[0]), int(dest[1]))
+        if src == dest:
+            return [src]
+
+        dist = _wavefront(self.free, src, dest)
+        self.expanded = int(np.count_nonzero(dist >= 0))
+        remaining = int(dist[dest])
+        if remaining < 0:
+            return []
+
+        # Walk back from the destination, one cell closer to the source each step
+        path = [dest]
+        row, col = dest
+        while remaining > 0:
+            remaining -= 1
+            for di, dj in DIRECTIONS_4:
+                new_row = row + di
+                new_col = col + dj
+                if 0 <= new_row < self.rows and 0 <= new_col < self.cols and dist[new_row, new_col] == remaining:
+                    row, col = new_row, new_col
+                    break
+            path.append((row, col))
+        path.reverse()
+        return path
+
+
+# Find a path with the wavefront engine and report the outcome like a_star_search
+def wavefront_search(grid, src, dest):
+    return run_search(grid, src, dest, WavefrontSearcher(grid).search)
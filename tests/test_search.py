@@ -0,0 +1,147 @@
+import heapq
+import math
+import random
+
+import numpy as np
+import pytest
+
+from pathfinding import DIRECTIONS_4, DIRECTIONS_8, GridSearcher, a_star_search
+from pathfinding.accelerated import AcceleratedSearcher
+
+ENGINES = (GridSearcher, AcceleratedSearcher)
+
+
+# The A* loop of the original main.py, kept as the reference for the paths it returned:
+# (f, row, col) heap entries, unit steps, Manhattan heuristic and the destination accepted
+# as soon as it is generated
+def baseline_a_star(grid, src, dest):
+    rows, cols = grid.shape
+    g = {src: 0.0}
+    f = {src: 0.0}
+    parent = {src: src}
+    closed = set()
+    open_list = [(0.0, src[0], src[1])]
+    while open_list:
+        _, i, j = heapq.heappop(open_list)
+        closed.add((i, j))
+        for di, dj in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            cell = (i + di, j + dj)
+            if not (0 <= cell[0] < rows and 0 <= cell[1] < cols) or grid[cell] != 1 or cell in closed:
+                continue
+            if cell == dest:
+                parent[cell] = (i, j)
+                path = [cell]
+                while parent[path[-1]] != path[-1]:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            g_new = g[i, j] + 1.0
+            f_new = g_new + abs(cell[0] - dest[0]) + abs(cell[1] - dest[1])
+            if cell not in f or f[cell] > f_new:
+                heapq.heappush(open_list, (f_new, cell[0], cell[1]))
+                f[cell] = f_new
+                g[cell] = g_new
+                parent[cell] = (i, j)
+    return []
+
+
+# Cost of a step onto cell, or None when the step is not allowed
+def step_cost(grid, costs, a, b, diagonal_cost, corner_cutting):
+    rows, cols = grid.shape
+
+    def free(cell):
+        return (0 <= cell[0] < rows and 0 <= cell[1] < cols and grid[cell] == 1
+                and (costs is None or np.isfinite(costs[cell])))
+
+    if not free(b):
+        return None
+    diagonal = a[0] != b[0] and a[1] != b[1]
+    if diagonal and not corner_cutting and not (free((a[0], b[1])) and free((b[0], a[1]))):
+        return None
+    step = diagonal_cost if diagonal else 1.0
+    return step * (float(costs[b]) if costs is not None else 1.0)
+
+
+# Cheapest cost from src to dest by plain Dijkstra, inf when dest cannot be reached
+def reference_cost(grid, costs, src, dest, directions, diagonal_cost, corner_cutting):
+    best = {src: 0.0}
+    open_list = [(0.0, src)]
+    while open_list:
+        d, cell = heapq.heappop(open_list)
+        if cell == dest:
+            return d
+        if d > best[cell]:
+            continue
+        for di, dj in directions:
+            other = (cell[0] + di, cell[1] + dj)
+            step = step_cost(grid, costs, cell, other, diagonal_cost, corner_cutting)
+            if step is not None and d + step < best.get(other, math.inf):
+                best[other] = d + step
+                heapq.heappush(open_list, (d + step, other))
+    return math.inf
+
+
+# Seeded grid with a fraction of blocked cells and random free (src, dest) queries
+def random_queries(seed, size, density, count):
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) >= density).astype(np.uint8)
+    free = [tuple(int(x) for x in cell) for cell in np.argwhere(grid == 1)]
+    picker = random.Random(seed)
+    queries = [(picker.choice(free), picker.choice(free)) for _ in range(count)]
+    return grid, [(src, dest) for src, dest in queries if src != dest]
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_paths_match_baseline(seed, capsys):
+    grid, queries = random_queries(seed, 40, 0.25, 20)
+    searchers = [engine(grid) for engine in ENGINES]
+    for src, dest in queries:
+        expected = baseline_a_star(grid, src, dest)
+        assert [tuple(cell) for cell in a_star_search(grid, src, dest)] == expected
+        for searcher in searchers:
+            assert [tuple(cell) for cell in searcher.search(src, dest)] == expected
+
+
+OPTIONS = {
+    'unit costs': dict(directions=DIRECTIONS_4),
+    'integer cost map': dict(directions=DIRECTIONS_4, costs='integer'),
+    'fractional cost map': dict(directions=DIRECTIONS_4, costs='fractional'),
+    'octile': dict(directions=DIRECTIONS_8),
+    'octile without corner cutting': dict(directions=DIRECTIONS_8, corner_cutting=False),
+    'chebyshev': dict(directions=DIRECTIONS_8, diagonal_cost=1.0),
+    'octile cost map': dict(directions=DIRECTIONS_8, costs='fractional', corner_cutting=False),
+}
+
+
+@pytest.mark.parametrize('engine', ENGINES, ids=lambda engine: engine.__name__)
+@pytest.mark.parametrize('name', OPTIONS)
+def test_costs_match_dijkstra(engine, name):
+    options = OPTIONS[name]
+    directions = options['directions']
+    diagonal_cost = options.get('diagonal_cost', math.sqrt(2.0))
+    corner_cutting = options.get('corner_cutting', True)
+    for seed in range(4):
+        grid, queries = random_queries(seed, 25, 0.3, 15)
+        rng = np.random.default_rng(seed)
+        costs = None
+        if options.get('costs') == 'integer':
+            costs = rng.integers(1, 6, grid.shape).astype(np.float32)
+        elif options.get('costs') == 'fractional':
+            costs = rng.uniform(0.5, 4.0, grid.shape).astype(np.float32)
+        if costs is not None:
+            costs[rng.random(grid.shape) < 0.05] = np.inf
+
+        searcher = engine(grid, directions, costs=costs, diagonal_cost=diagonal_cost, corner_cutting=corner_cutting)
+        for src, dest in queries:
+            expected = reference_cost(grid, costs, src, dest, directions, diagonal_cost, corner_cutting)
+            path = searcher.search(src, dest)
+            if expected == math.inf or step_cost(grid, costs, src, src, 1.0, True) is None:
+                assert not path
+                continue
+            assert path[0] == src and path[-1] == dest
+            total = 0.0
+            for a, b in zip(path, path[1:]):
+                assert (b[0] - a[0], b[1] - a[1]) in directions
+                step = step_cost(grid, costs, a, b, diagonal_cost, corner_cutting)
+                assert step is not None
+                total += step
+            assert total == pytest.approx(expected, rel=1e-5)